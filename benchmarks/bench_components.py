@@ -0,0 +1,118 @@
+"""
+Benchmarks for ArcaneWeaver Entity System Components.
+
+Runs each scenario over a sweep of workload sizes and prints the best time
+per run, so changes to the component internals can be compared across scales:
+- StatsComponent.add_stat (N stats)
+- StatsComponent.modify_stat (M mutations on N stats)
+- InventoryCellComponent.add_items (K stacking operations)
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_components.py [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from arcaneweaver.core.entity_system.components import InventoryCellComponent, StatsComponent
+
+SEED = 42
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A benchmark scenario run over several workloads.
+
+    Attributes:
+        name: Name printed in the results table.
+        setup: Builds the state for one workload; called outside the timed region.
+        run: The timed operation, called with the state returned by setup.
+        workloads: Parameter sets passed to setup.
+    """
+
+    name: str
+    setup: Callable[..., Any]
+    run: Callable[[Any], Any]
+    workloads: List[Dict[str, int]]
+
+
+def _stat_names(n: int) -> List[str]:
+    """Returns n distinct stat names."""
+    return [f"stat_{i}" for i in range(n)]
+
+
+def setup_add_stats(n: int) -> List[str]:
+    """Prepares the names of n stats to add."""
+    return _stat_names(n)
+
+
+def run_add_stats(names: List[str]) -> None:
+    """Adds every named stat to a new StatsComponent."""
+    stats = StatsComponent()
+    for name in names:
+        stats.add_stat(name, 10.0, min_value=0.0, max_value=100.0)
+
+
+def setup_modify_stats(n: int, m: int) -> Any:
+    """Builds a StatsComponent with n stats and m random (name, modifier) pairs."""
+    stats = StatsComponent()
+    names = _stat_names(n)
+    for name in names:
+        stats.add_stat(name, 50.0, min_value=0.0, max_value=100.0)
+    rng = random.Random(SEED)
+    mutations = [(rng.choice(names), rng.uniform(-10.0, 10.0)) for _ in range(m)]
+    return stats, mutations
+
+
+def run_modify_stats(state: Any) -> None:
+    """Applies every prepared modifier through modify_stat."""
+    stats, mutations = state
+    for name, modifier in mutations:
+        stats.modify_stat(name, modifier)
+
+
+def setup_stack_items(k: int) -> Any:
+    """Prepares k random stack amounts."""
+    rng = random.Random(SEED)
+    return [rng.randint(1, 5) for _ in range(k)]
+
+
+def run_stack_items(amounts: List[int]) -> None:
+    """Stacks the amounts into one cell, clearing it whenever it is full."""
+    cell = InventoryCellComponent(max_stack_size=99)
+    for amount in amounts:
+        if cell.add_items("arrow", amount) == 0:
+            cell.clear_slot()
+
+
+SCENARIOS = [
+    Scenario("add_stat", setup_add_stats, run_add_stats, [{"n": n} for n in (10, 100, 1000)]),
+    Scenario(
+        "modify_stat",
+        setup_modify_stats,
+        run_modify_stats,
+        [{"n": n, "m": m} for n in (10, 100, 1000) for m in (0, 100, 10000)],
+    ),
+    Scenario("cell_add_items", setup_stack_items, run_stack_items, [{"k": k} for k in (10, 1000, 100000)]),
+]
+
+
+def main() -> None:
+    """Runs every scenario and prints the best time of each workload."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per workload (best is reported)")
+    args = parser.parse_args()
+
+    for scenario in SCENARIOS:
+        for workload in scenario.workloads:
+            state = scenario.setup(**workload)
+            best = min(timeit.repeat(lambda: scenario.run(state), number=1, repeat=args.repeat))
+            params = " ".join(f"{key}={value}" for key, value in workload.items())
+            print(f"{scenario.name:<16} {params:<16} {best * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
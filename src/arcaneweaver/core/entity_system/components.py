@@ -13,15 +13,24 @@ __all__ = [
     "InventoryComponent",
     "ComponentType",
     "FieldType",
+    "StatData",
+    "CellData",
 ]
 
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
-from typing import Dict, List, Optional, Any, Union, get_origin, get_args
-from enum import Enum
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator, ConfigDict
+from typing import ClassVar, Dict, Iterable, Iterator, List, Mapping, Optional, Self, Tuple, Any, Union, get_origin, get_args
+import bisect
+import heapq
+import sys
+import weakref
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
 from pydantic.fields import FieldInfo
 
 
-class FieldType(Enum):
+class FieldType(StrEnum):
     """Enumeration of supported field types for UI rendering."""
 
     NUMBER = "number"
@@ -33,7 +42,7 @@ class FieldType(Enum):
     TEXTAREA = "textarea"
 
 
-class ComponentType(Enum):
+class ComponentType(StrEnum):
     """Enumeration of component types for categorization."""
 
     STAT = "stat"
@@ -41,6 +50,243 @@ class ComponentType(Enum):
     CUSTOM = "custom"
 
 
+# Field types for annotations that map directly onto a UI widget
+_DIRECT_FIELD_TYPES: Dict[Any, FieldType] = {
+    int: FieldType.NUMBER,
+    float: FieldType.NUMBER,
+    str: FieldType.TEXT,
+    bool: FieldType.CHECKBOX,
+    list: FieldType.LIST,
+    dict: FieldType.OBJECT,
+}
+
+# Field types for parametrized generics, keyed by get_origin() of the annotation
+_ORIGIN_FIELD_TYPES: Dict[Any, FieldType] = {
+    list: FieldType.LIST,
+    dict: FieldType.OBJECT,
+}
+
+# Field types for the first non-None member of Optional/Union annotations; only
+# scalar members are recognized there. bool is a distinct key, so it can never be
+# misclassified as a number the way an isinstance(int) check would.
+_UNION_MEMBER_FIELD_TYPES: Dict[Any, FieldType] = {
+    bool: FieldType.CHECKBOX,
+    int: FieldType.NUMBER,
+    float: FieldType.NUMBER,
+    str: FieldType.TEXT,
+}
+
+
+def _lookup_field_type(table: Dict[Any, FieldType], key: Any) -> Optional[FieldType]:
+    """Looks up a field type, treating unhashable keys as missing.
+
+    Annotated metadata can be unhashable (e.g. a dict), which makes the whole
+    annotation unhashable.
+
+    Args:
+        table: One of the field type dispatch dicts.
+        key: Annotation (or annotation member) to look up.
+
+    Returns:
+        The field type, or None if the key is not in the table or cannot be hashed.
+    """
+    try:
+        return table.get(key)
+    except TypeError:
+        return None
+
+
+def _compute_annotation_type(annotation: Any) -> FieldType:
+    """Infers UI field type from a type annotation, without caching.
+
+    Args:
+        annotation: Type annotation of a Pydantic field.
+
+    Returns:
+        FieldType enum representing the UI field type.
+    """
+    field_type = _lookup_field_type(_DIRECT_FIELD_TYPES, annotation)
+    if field_type is not None:
+        return field_type
+
+    # Handle generic types (List, Optional, Union, etc.)
+    origin = get_origin(annotation)
+    field_type = _ORIGIN_FIELD_TYPES.get(origin)
+    if field_type is not None:
+        return field_type
+
+    if origin is Union:
+        # Extract the inner type (Optional[T] is Union[T, None])
+        args = get_args(annotation)
+        if args:
+            # Filter out None type and get the first non-None type
+            non_none_args = [arg for arg in args if arg is not type(None)]
+            if non_none_args:
+                field_type = _lookup_field_type(_UNION_MEMBER_FIELD_TYPES, non_none_args[0])
+                if field_type is not None:
+                    return field_type
+
+    # Default to text for unknown types
+    return FieldType.TEXT
+
+
+_cached_annotation_type = lru_cache(maxsize=512)(_compute_annotation_type)
+
+
+def _infer_annotation_type(annotation: Any) -> FieldType:
+    """Infers UI field type from a type annotation.
+
+    Results are cached per annotation object, so repeated lookups for the same
+    field type cost a single hash probe. Annotations that cannot be hashed,
+    e.g. List[Annotated[int, {"ge": 0}]], are inferred without the cache.
+
+    Args:
+        annotation: Type annotation of a Pydantic field.
+
+    Returns:
+        FieldType enum representing the UI field type.
+    """
+    try:
+        return _cached_annotation_type(annotation)
+    except TypeError:
+        return _compute_annotation_type(annotation)
+
+
+@lru_cache(maxsize=1024)
+def _extra_field_config(field_name: str, field_type: FieldType) -> Dict[str, Any]:
+    """Builds the editor configuration of an extra (dynamic) field.
+
+    The result is cached and shared, so callers must copy it before handing it out.
+
+    Args:
+        field_name: Name of the extra field.
+        field_type: UI field type inferred from the field's value.
+
+    Returns:
+        Dictionary with the field configuration.
+    """
+    return {
+        "type": field_type,
+        "label": field_name.replace("_", " ").title(),
+        "description": f"Dynamic attribute: {field_name}",
+        "required": False,
+    }
+
+
+def _clamp(value: float, min_value: Optional[float], max_value: Optional[float]) -> float:
+    """Constrains a value to optional min/max bounds.
+
+    Comparisons with NaN are false, so a NaN value passes through unchanged.
+
+    Args:
+        value: The value to constrain.
+        min_value: Optional lower bound.
+        max_value: Optional upper bound.
+
+    Returns:
+        The value constrained within the given bounds.
+    """
+    if min_value is not None and value < min_value:
+        return min_value
+    if max_value is not None and value > max_value:
+        return max_value
+    return value
+
+
+def _plain_stat_args(
+    name: Any,
+    base_value: Any,
+    current_value: Any,
+    min_value: Any,
+    max_value: Any,
+    description: Any,
+) -> bool:
+    """Checks whether StatComponent arguments already have their exact field types.
+
+    Such arguments need no coercion, so a stat can be built from them without
+    running the Pydantic validators.
+    """
+    numbers = (float, int)
+    return (
+        type(name) is str
+        and type(description) is str
+        and type(base_value) in numbers
+        and (current_value is None or type(current_value) in numbers)
+        and (min_value is None or type(min_value) in numbers)
+        and (max_value is None or type(max_value) in numbers)
+    )
+
+
+def _intern(value: str) -> str:
+    """Interns a string so equal identifiers share one object.
+
+    str subclasses (e.g. StrEnum members) cannot be interned and are returned as-is.
+
+    Args:
+        value: The string to intern.
+
+    Returns:
+        The interned string, or the original value for str subclasses.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# UI constraints keyed by the FieldInfo object itself (identity hash). Holding the
+# key keeps the object alive, so an id() can never be reused by another field.
+_FIELD_CONSTRAINTS_CACHE: Dict[FieldInfo, Dict[str, Any]] = {}
+
+
+def _extract_field_constraints(field_info: FieldInfo) -> Dict[str, Any]:
+    """Extracts validation constraints from Pydantic field without caching.
+
+    Args:
+        field_info: Pydantic field information object.
+
+    Returns:
+        Dictionary of constraints for UI validation.
+    """
+    constraints = {}
+
+    # Extract constraints from Field constraints (Pydantic v2 way)
+    # Check for ge, gt, le, lt, min_length, max_length constraints
+    if hasattr(field_info, "constraints") and field_info.constraints:
+        constraints_dict = field_info.constraints
+        if "ge" in constraints_dict:
+            constraints["min"] = constraints_dict["ge"]
+        if "gt" in constraints_dict:
+            # For UI, we want inclusive min, so gt means min = gt + 1
+            constraints["min"] = constraints_dict["gt"]
+            constraints["exclusiveMin"] = True
+        if "le" in constraints_dict:
+            constraints["max"] = constraints_dict["le"]
+        if "lt" in constraints_dict:
+            # For UI, we want inclusive max, so lt means max = lt - 1
+            constraints["max"] = constraints_dict["lt"]
+            constraints["exclusiveMax"] = True
+        if "min_length" in constraints_dict:
+            constraints["minLength"] = constraints_dict["min_length"]
+        if "max_length" in constraints_dict:
+            constraints["maxLength"] = constraints_dict["max_length"]
+
+    # Fallback: try to extract from metadata for compatibility
+    if not constraints:
+        metadata = getattr(field_info, "metadata", None) or []
+        for meta_item in metadata:
+            if isinstance(meta_item, dict):
+                if "ge" in meta_item:
+                    constraints["min"] = meta_item["ge"]
+                if "le" in meta_item:
+                    constraints["max"] = meta_item["le"]
+                if "gt" in meta_item:
+                    constraints["min"] = meta_item["gt"]
+                    constraints["exclusiveMin"] = True
+                if "lt" in meta_item:
+                    constraints["max"] = meta_item["lt"]
+                    constraints["exclusiveMax"] = True
+
+    return constraints
+
+
 class ComponentModel(BaseModel):
     """Base class for all entity components.
 
@@ -53,8 +299,22 @@ class ComponentModel(BaseModel):
     """
 
     model_config = ConfigDict(extra="allow", validate_assignment=True, arbitrary_types_allowed=True)
+    _editor_config_base: ClassVar[Dict[type, Dict[str, Dict[str, Any]]]] = {}
+    _editor_field_items: ClassVar[Tuple[Tuple[str, FieldInfo], ...]] = ()
     component_type: ComponentType = Field(default=ComponentType.CUSTOM, description="Component category")
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Prepares the editor configuration once, after Pydantic has built the subclass.
+
+        Classes with unresolved forward references build their configuration
+        lazily on first use instead.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._editor_field_items = _collect_editor_field_items(cls)
+        if cls.__pydantic_complete__:
+            ComponentModel._editor_config_base[cls] = _build_editor_base_config(cls)
+
     def get_editor_config(self) -> Dict[str, Any]:
         """Generates UI configuration from Pydantic model fields.
 
@@ -64,40 +324,75 @@ class ComponentModel(BaseModel):
         Returns:
             Dictionary containing field configurations for UI rendering.
         """
-        config = {}
-
-        # Include defined fields
-        for field_name, field_info in type(self).model_fields.items():
-            if field_name == "component_type":
-                continue  # Skip component_type field in editor
+        return dict(self.iter_editor_config())
 
-            field_config = {
-                "type": self._infer_field_type(field_info),
-                "label": field_name.replace("_", " ").title(),
-                "description": field_info.description or "",
-                "required": field_info.is_required(),
-            }
+    def iter_editor_config(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yields UI configuration entries one field at a time.
 
-            # Add field-specific constraints
-            constraints = self._get_field_constraints(field_info)
-            if constraints:
-                field_config.update(constraints)
+        Lets callers stream the configuration (e.g. into a JSON encoder) without
+        materializing the whole dictionary. The configuration of declared fields
+        depends only on the class, so it is built once per class and reused; only
+        extra fields are inspected per call.
 
-            config[field_name] = field_config
+        Yields:
+            Tuples of (field name, field configuration), declared fields first.
+        """
+        # Copy per-field dicts so callers cannot corrupt the class-level cache
+        for field_name, field_config in type(self)._get_editor_base_config().items():
+            yield field_name, dict(field_config)
 
-        # Include extra fields
+        # Include extra fields; their configuration depends only on name and value type
         if self.model_extra:
             for field_name, field_value in self.model_extra.items():
-                config[field_name] = {
-                    "type": self._infer_value_type(field_value),
-                    "label": field_name.replace("_", " ").title(),
-                    "description": f"Dynamic attribute: {field_name}",
-                    "required": False,
-                }
+                yield field_name, dict(_extra_field_config(field_name, self._infer_value_type(field_value)))
+
+    @classmethod
+    def load_json(cls, raw: Union[str, bytes]) -> Self:
+        """Creates a component from a JSON document.
 
-        return config
+        Parsing and validation happen in a single pass in pydantic-core, without
+        building an intermediate Python dict as json.loads + model_validate would.
 
-    def _infer_field_type(self, field_info: FieldInfo) -> FieldType:
+        Args:
+            raw: JSON document describing one component.
+
+        Returns:
+            The validated component instance.
+        """
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def load_json_list(cls, raw: Union[str, bytes]) -> List[Self]:
+        """Creates a list of components from a JSON array.
+
+        Args:
+            raw: JSON array where each element describes one component.
+
+        Returns:
+            List of validated component instances.
+        """
+        return _list_adapter(cls).validate_json(raw)
+
+    @classmethod
+    def _get_editor_base_config(cls) -> Dict[str, Dict[str, Any]]:
+        """Returns the cached editor configuration of the declared fields.
+
+        The result is shared between all instances of the class and must be
+        treated as read-only.
+
+        Returns:
+            Dictionary containing field configurations for declared fields.
+        """
+        base_config = ComponentModel._editor_config_base.get(cls)
+        if base_config is None:
+            # Fields may have been re-collected when a deferred model was rebuilt
+            cls._editor_field_items = _collect_editor_field_items(cls)
+            base_config = _build_editor_base_config(cls)
+            ComponentModel._editor_config_base[cls] = base_config
+        return base_config
+
+    @classmethod
+    def _infer_field_type(cls, field_info: FieldInfo) -> FieldType:
         """Infers UI field type from Pydantic field information.
 
         Args:
@@ -106,44 +401,7 @@ class ComponentModel(BaseModel):
         Returns:
             FieldType enum representing the UI field type.
         """
-        annotation = field_info.annotation
-
-        # Handle direct type checks
-        if annotation is int or annotation is float:
-            return FieldType.NUMBER
-        elif annotation is str:
-            return FieldType.TEXT
-        elif annotation is bool:
-            return FieldType.CHECKBOX
-        elif annotation is list:
-            return FieldType.LIST
-        elif annotation is dict:
-            return FieldType.OBJECT
-
-        # Handle generic types (List, Optional, Union, etc.)
-        origin = get_origin(annotation)
-        if origin is not None:
-            if origin is list:
-                return FieldType.LIST
-            elif origin is dict:
-                return FieldType.OBJECT
-            elif origin is Union:
-                # Extract the inner type (Optional[T] is Union[T, None])
-                args = get_args(annotation)
-                if args:
-                    # Filter out None type and get the first non-None type
-                    non_none_args = [arg for arg in args if arg is not type(None)]
-                    if non_none_args:
-                        inner_annotation = non_none_args[0]
-                        if inner_annotation is int or inner_annotation is float:
-                            return FieldType.NUMBER
-                        elif inner_annotation is str:
-                            return FieldType.TEXT
-                        elif inner_annotation is bool:
-                            return FieldType.CHECKBOX
-
-        # Default to text for unknown types
-        return FieldType.TEXT
+        return _infer_annotation_type(field_info.annotation)
 
     def _infer_value_type(self, value: Any) -> FieldType:
         """Infers UI field type from a Python value.
@@ -154,6 +412,11 @@ class ComponentModel(BaseModel):
         Returns:
             FieldType enum representing the UI field type.
         """
+        # Exact builtin types resolve with one lookup; subclasses fall through
+        field_type = _DIRECT_FIELD_TYPES.get(type(value))
+        if field_type is not None:
+            return field_type
+
         # Check bool first since bool is a subclass of int in Python
         if isinstance(value, bool):
             return FieldType.CHECKBOX
@@ -168,57 +431,292 @@ class ComponentModel(BaseModel):
         else:
             return FieldType.TEXT
 
-    def _get_field_constraints(self, field_info: FieldInfo) -> Dict[str, Any]:
+    @classmethod
+    def _get_field_constraints(cls, field_info: FieldInfo) -> Dict[str, Any]:
         """Extracts validation constraints from Pydantic field.
 
+        FieldInfo objects are fixed once a model class is built, so the result is
+        cached per FieldInfo object and must be treated as read-only.
+
         Args:
             field_info: Pydantic field information object.
 
         Returns:
             Dictionary of constraints for UI validation.
         """
-        constraints = {}
-
-        # Extract constraints from Field constraints (Pydantic v2 way)
-        # Check for ge, gt, le, lt, min_length, max_length constraints
-        if hasattr(field_info, "constraints") and field_info.constraints:
-            constraints_dict = field_info.constraints
-            if "ge" in constraints_dict:
-                constraints["min"] = constraints_dict["ge"]
-            if "gt" in constraints_dict:
-                # For UI, we want inclusive min, so gt means min = gt + 1
-                constraints["min"] = constraints_dict["gt"]
-                constraints["exclusiveMin"] = True
-            if "le" in constraints_dict:
-                constraints["max"] = constraints_dict["le"]
-            if "lt" in constraints_dict:
-                # For UI, we want inclusive max, so lt means max = lt - 1
-                constraints["max"] = constraints_dict["lt"]
-                constraints["exclusiveMax"] = True
-            if "min_length" in constraints_dict:
-                constraints["minLength"] = constraints_dict["min_length"]
-            if "max_length" in constraints_dict:
-                constraints["maxLength"] = constraints_dict["max_length"]
-
-        # Fallback: try to extract from metadata for compatibility
-        if not constraints:
-            metadata = getattr(field_info, "metadata", None) or []
-            for meta_item in metadata:
-                if isinstance(meta_item, dict):
-                    if "ge" in meta_item:
-                        constraints["min"] = meta_item["ge"]
-                    if "le" in meta_item:
-                        constraints["max"] = meta_item["le"]
-                    if "gt" in meta_item:
-                        constraints["min"] = meta_item["gt"]
-                        constraints["exclusiveMin"] = True
-                    if "lt" in meta_item:
-                        constraints["max"] = meta_item["lt"]
-                        constraints["exclusiveMax"] = True
-
+        constraints = _FIELD_CONSTRAINTS_CACHE.get(field_info)
+        if constraints is None:
+            constraints = _extract_field_constraints(field_info)
+            _FIELD_CONSTRAINTS_CACHE[field_info] = constraints
         return constraints
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(cls: type) -> TypeAdapter:
+    """Returns a TypeAdapter for a list of the given component class.
+
+    Building a TypeAdapter compiles a validation schema, so one is kept per class.
+
+    Args:
+        cls: Component or runtime data class of the list elements.
+
+    Returns:
+        TypeAdapter validating List[cls].
+    """
+    return TypeAdapter(List[cls])
+
+
+def _collect_editor_field_items(cls: type) -> Tuple[Tuple[str, FieldInfo], ...]:
+    """Collects the declared fields of a component class shown in the editor.
+
+    Args:
+        cls: ComponentModel subclass to inspect.
+
+    Returns:
+        Tuple of (field name, FieldInfo) pairs, excluding component_type.
+    """
+    return tuple(
+        (field_name, field_info)
+        for field_name, field_info in cls.model_fields.items()
+        if field_name != "component_type"  # Skip component_type field in editor
+    )
+
+
+def _build_editor_base_config(cls: type) -> Dict[str, Dict[str, Any]]:
+    """Builds the editor configuration of the fields declared on a component class.
+
+    Args:
+        cls: ComponentModel subclass to inspect.
+
+    Returns:
+        Dictionary containing field configurations for declared fields.
+    """
+    config = {}
+
+    for field_name, field_info in cls._editor_field_items:
+        field_config = {
+            "type": cls._infer_field_type(field_info),
+            "label": field_name.replace("_", " ").title(),
+            "description": field_info.description or "",
+            "required": field_info.is_required(),
+        }
+
+        # Add field-specific constraints
+        constraints = cls._get_field_constraints(field_info)
+        if constraints:
+            field_config.update(constraints)
+
+        config[field_name] = field_config
+
+    return config
+
+
+def _construct_trusted(model_cls: type, data: Dict[str, Any]) -> Any:
+    """Creates a component from trusted data without running validation.
+
+    Args:
+        model_cls: ComponentModel subclass to create.
+        data: Field values, e.g. produced by model_dump().
+
+    Returns:
+        Instance of model_cls built with model_construct.
+    """
+    if "component_type" in data:
+        data = {**data, "component_type": ComponentType(data["component_type"])}
+    return model_cls.model_construct(**data)
+
+
+# __pydantic_init_subclass__ only runs for subclasses, so fill in the base class here
+ComponentModel._editor_field_items = _collect_editor_field_items(ComponentModel)
+ComponentModel._editor_config_base[ComponentModel] = _build_editor_base_config(ComponentModel)
+
+
+@dataclass(slots=True)
+class StatData:
+    """Lightweight runtime counterpart of StatComponent.
+
+    A slotted dataclass without Pydantic validation, meant for hot game loops
+    that mutate many statistics. Convert with StatComponent.to_data() and
+    StatComponent.from_data() at serialization or editor boundaries. Extra
+    fields of the component are not carried over.
+
+    Attributes:
+        name: Unique identifier for this statistic.
+        base_value: The base numeric value of the statistic.
+        current_value: The current modified value.
+        min_value: Optional minimum constraint for the value.
+        max_value: Optional maximum constraint for the value.
+        description: Human-readable description of what this statistic represents.
+    """
+
+    name: str
+    base_value: float = 0.0
+    current_value: float = 0.0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    description: str = ""
+
+    @classmethod
+    def load_json_list(cls, raw: Union[str, bytes]) -> List["StatData"]:
+        """Creates a list of statistics from a JSON array in one validation pass.
+
+        Args:
+            raw: JSON array where each element holds the fields of one StatData.
+
+        Returns:
+            List of StatData instances.
+        """
+        return _list_adapter(cls).validate_json(raw)
+
+    @classmethod
+    def dump_json_list(cls, items: List["StatData"]) -> bytes:
+        """Serializes a list of statistics to a JSON array.
+
+        Args:
+            items: StatData instances to serialize.
+
+        Returns:
+            UTF-8 encoded JSON array.
+        """
+        return _list_adapter(cls).dump_json(items)
+
+    def modify_value(self, modifier: float) -> float:
+        """Applies a modifier to the current value.
+
+        Args:
+            modifier: The amount to add to the current value.
+
+        Returns:
+            The new current value after modification (constrained by min/max).
+        """
+        new_value = _clamp(self.current_value + modifier, self.min_value, self.max_value)
+        self.current_value = new_value
+        return new_value
+
+    def reset_to_base(self) -> None:
+        """Resets the current value to the base value."""
+        self.current_value = self.base_value
+
+    def set_base_value(self, new_value: float) -> float:
+        """Sets both base and current values to the new value.
+
+        Args:
+            new_value: The new value to set.
+
+        Returns:
+            The new base value after setting (constrained by min/max).
+        """
+        new_value = _clamp(new_value, self.min_value, self.max_value)
+        self.base_value = new_value
+        self.current_value = new_value
+        return new_value
+
+
+@dataclass(slots=True)
+class CellData:
+    """Lightweight runtime counterpart of InventoryCellComponent.
+
+    A slotted dataclass without Pydantic validation, meant for hot game loops
+    that move many items. Convert with InventoryCellComponent.to_data() and
+    InventoryCellComponent.from_data() at serialization or editor boundaries.
+    Extra fields of the component are not carried over.
+
+    Attributes:
+        item_id: Unique identifier of the item in this cell.
+        quantity: Current number of items in the stack.
+        max_stack_size: Maximum number of items that can be stacked.
+        slot_type: Optional type restriction for items that can go in this cell.
+        is_equipped: Whether this item is currently equipped.
+    """
+
+    item_id: Optional[str] = None
+    quantity: int = 0
+    max_stack_size: int = 1
+    slot_type: Optional[str] = None
+    is_equipped: bool = False
+
+    @classmethod
+    def load_json_list(cls, raw: Union[str, bytes]) -> List["CellData"]:
+        """Creates a list of cells from a JSON array in one validation pass.
+
+        Args:
+            raw: JSON array where each element holds the fields of one CellData.
+
+        Returns:
+            List of CellData instances.
+        """
+        return _list_adapter(cls).validate_json(raw)
+
+    @classmethod
+    def dump_json_list(cls, items: List["CellData"]) -> bytes:
+        """Serializes a list of cells to a JSON array.
+
+        Args:
+            items: CellData instances to serialize.
+
+        Returns:
+            UTF-8 encoded JSON array.
+        """
+        return _list_adapter(cls).dump_json(items)
+
+    def is_empty(self) -> bool:
+        """Checks if the cell is empty.
+
+        Returns:
+            True if the cell contains no items, False otherwise.
+        """
+        return self.quantity == 0 or self.item_id is None
+
+    def is_full(self) -> bool:
+        """Checks if the cell is at full capacity.
+
+        Returns:
+            True if the cell is at maximum stack size, False otherwise.
+        """
+        return self.quantity >= self.max_stack_size
+
+    def add_items(self, item_id: str, add_quantity: int) -> int:
+        """Adds items to the cell.
+
+        Args:
+            item_id: The identifier of the items to add.
+            add_quantity: The number of items to add.
+
+        Returns:
+            The number of items actually added (may be less due to stack limits).
+        """
+        if add_quantity <= 0 or (not self.is_empty() and self.item_id != item_id):
+            return 0
+
+        actual_add = min(add_quantity, self.max_stack_size - self.quantity)
+        self.item_id = item_id
+        self.quantity += actual_add
+        return actual_add
+
+    def remove_items(self, remove_quantity: int) -> int:
+        """Removes items from the cell.
+
+        Args:
+            remove_quantity: The number of items to remove.
+
+        Returns:
+            The number of items actually removed.
+        """
+        if remove_quantity <= 0 or self.is_empty():
+            return 0
+
+        actual_remove = min(remove_quantity, self.quantity)
+        self.quantity -= actual_remove
+        if self.quantity == 0:
+            self.item_id = None
+        return actual_remove
+
+
+# Bumped whenever a stat is renamed, so StatsComponent name indexes know to resync.
+# A module global, since class attribute reads on models are several times slower.
+_stat_renames = 0
+
+
 class StatComponent(ComponentModel):
     """Component representing a single character statistic or attribute.
 
@@ -241,104 +739,338 @@ class StatComponent(ComponentModel):
     min_value: Optional[float] = Field(default=None, description="Minimum allowed value")
     max_value: Optional[float] = Field(default=None, description="Maximum allowed value")
     description: str = Field(default="", description="Description of what this statistic represents")
+    # Fields whose int/float assignments may skip Pydantic validation; set per class
+    _fast_assign_fields: ClassVar[frozenset] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Decides whether the subclass may use the fast value assignment path."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._fast_assign_fields = _stat_fast_assign_fields(cls)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assigns an attribute, clamping plain numbers for base/current values directly.
+
+        Clamping is all the validation base_value and current_value need, so
+        int and float values skip Pydantic's assignment validation. Subclasses
+        that freeze the model or add validators keep full validation, as does
+        any other assignment.
+        """
+        if name in self._fast_assign_fields and type(value) in (float, int):
+            value = float(value)
+            min_value = self.min_value
+            max_value = self.max_value
+            # Most stats are unbounded; skip the clamp call for them
+            if min_value is not None or max_value is not None:
+                value = _clamp(value, min_value, max_value)
+            object.__setattr__(self, name, value)
+            self.__pydantic_fields_set__.add(name)
+            return
+        super().__setattr__(name, value)
+        if name == "name":
+            global _stat_renames
+            _stat_renames += 1
+
+    @model_validator(mode="before")
+    @classmethod
+    def default_current_value(cls, data: Any) -> Any:
+        """Defaults current_value to base_value when it is not provided.
+
+        Runs as a validator rather than in __init__ so that model_validate and
+        model_validate_json apply the same default.
+
+        Args:
+            data: Raw input data for the model.
+
+        Returns:
+            Input data with current_value filled in if needed.
+        """
+        if isinstance(data, dict) and "current_value" not in data and "base_value" in data:
+            data = {**data, "current_value": data["base_value"]}
+        return data
+
+    @field_validator("name")
+    @classmethod
+    def intern_name(cls, name: str) -> str:
+        """Interns the statistic name.
+
+        Names repeat across many entities; interning shares one string object
+        per name and lets equality checks short-circuit on identity.
+
+        Args:
+            name: The statistic name to intern.
+
+        Returns:
+            The interned name.
+        """
+        return _intern(name)
+
+    @field_validator("current_value")
+    @classmethod
+    def validate_current_value(cls, current_value: float, validation_info) -> float:
+        """Ensures current_value respects min_value and max_value constraints.
+
+        Args:
+            current_value: The current value to validate.
+            validation_info: Validation context containing other field values.
+
+        Returns:
+            Validated current value, constrained within min/max bounds.
+        """
+        values = validation_info.data
+        return _clamp(current_value, values.get("min_value"), values.get("max_value"))
+
+    @field_validator("base_value")
+    @classmethod
+    def validate_base_value(cls, base_value: float, validation_info) -> float:
+        """Ensures base_value respects min_value and max_value constraints.
+
+        Args:
+            base_value: The base value to validate.
+            validation_info: Validation context containing other field values.
+
+        Returns:
+            Validated base value, constrained within min/max bounds.
+        """
+        values = validation_info.data
+        return _clamp(base_value, values.get("min_value"), values.get("max_value"))
+
+    def modify_value(self, modifier: float) -> float:
+        """Applies a modifier to the current value.
+
+        Args:
+            modifier: The amount to add to the current value.
+
+        Returns:
+            The new current value after modification (constrained by min/max).
+        """
+        new_value = self.current_value + modifier
+        if "current_value" not in self._fast_assign_fields:
+            # Subclasses off the fast path may not validate assignments at all
+            new_value = _clamp(new_value, self.min_value, self.max_value)
+        self.current_value = new_value
+        return self.current_value
+
+    def reset_to_base(self) -> None:
+        """Resets the current value to the base value.
+
+        Note: The value is clamped to min/max on assignment.
+        """
+        self.current_value = self.base_value
+
+    def set_base_value(self, new_value: float) -> float:
+        """Sets both base and current values to the new value.
+
+        Args:
+            new_value: The new value to set.
+
+        Returns:
+            The new base value after setting (constrained by min/max).
+        """
+        if "base_value" not in self._fast_assign_fields:
+            # Subclasses off the fast path may not validate assignments at all
+            new_value = _clamp(new_value, self.min_value, self.max_value)
+        # The assigned base is clamped, so current_value copies it
+        self.base_value = new_value
+        self.current_value = self.base_value
+        return self.base_value
+
+    @classmethod
+    def _fast_new(
+        cls,
+        name: str,
+        base_value: float,
+        current_value: Optional[float] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        description: str = "",
+    ) -> "StatComponent":
+        """Creates a StatComponent from arguments of the exact field types, skipping validation.
+
+        Produces the same stat as the validating constructor, which sees no
+        bounds yet when base_value and current_value are validated, so values
+        are converted to float but not clamped. Callers must check the argument
+        types first (see _plain_stat_args).
+
+        Returns:
+            The created StatComponent instance.
+        """
+        base_value = float(base_value)
+        return cls.model_construct(
+            name=_intern(name),
+            base_value=base_value,
+            current_value=base_value if current_value is None else float(current_value),
+            min_value=None if min_value is None else float(min_value),
+            max_value=None if max_value is None else float(max_value),
+            description=description,
+        )
+
+    @classmethod
+    def from_data(cls, data: StatData) -> "StatComponent":
+        """Creates a validated StatComponent from its runtime counterpart.
+
+        Args:
+            data: StatData instance to convert.
+
+        Returns:
+            The created StatComponent instance.
+        """
+        args = (data.name, data.base_value, data.current_value, data.min_value, data.max_value, data.description)
+        if cls is StatComponent and _plain_stat_args(*args):
+            return cls._fast_new(*args)
+        return cls(
+            name=data.name,
+            base_value=data.base_value,
+            current_value=data.current_value,
+            min_value=data.min_value,
+            max_value=data.max_value,
+            description=data.description,
+        )
+
+    def to_data(self) -> StatData:
+        """Converts this statistic to its lightweight runtime counterpart.
+
+        Returns:
+            StatData instance with the same field values.
+        """
+        return StatData(
+            name=self.name,
+            base_value=self.base_value,
+            current_value=self.current_value,
+            min_value=self.min_value,
+            max_value=self.max_value,
+            description=self.description,
+        )
+
+
+def _validator_funcs(cls: type) -> Dict[str, Any]:
+    """Returns the field and model validator functions of a model class by name."""
+    decorators = cls.__pydantic_decorators__
+    validators = {**decorators.field_validators, **decorators.model_validators}
+    return {name: getattr(decorator.func, "__func__", decorator.func) for name, decorator in validators.items()}
+
+
+def _stat_fast_assign_fields(cls: type) -> frozenset:
+    """Works out which fields of a StatComponent class may use the fast assignment path.
+
+    The fast path reproduces StatComponent's own validation only, so it is
+    disabled for classes that freeze the model, turn off assignment validation,
+    add or replace validators, or redeclare base_value/current_value with
+    other types or constraints.
+
+    Args:
+        cls: StatComponent or one of its subclasses.
+
+    Returns:
+        The field names that may skip assignment validation (possibly empty).
+    """
+    config = cls.model_config
+    if config.get("frozen") or not config.get("validate_assignment"):
+        return frozenset()
+    if _validator_funcs(cls) != _STAT_VALIDATOR_FUNCS:
+        return frozenset()
+    for field_name in ("base_value", "current_value"):
+        field_info = cls.model_fields[field_name]
+        if field_info.annotation is not float or field_info.metadata or field_info.frozen:
+            return frozenset()
+    return frozenset({"base_value", "current_value"})
+
+
+_STAT_VALIDATOR_FUNCS = _validator_funcs(StatComponent)
+StatComponent._fast_assign_fields = _stat_fast_assign_fields(StatComponent)
+
+
+class _TrackedList(list):
+    """List whose in-place changes mark the index built from it stale.
+
+    Used for the stats and cells lists. The index object keeps the list it was
+    built from in its source attribute; clearing it makes the owning component
+    rebuild the index on next use.
+    """
 
-    def __init__(self, **data):
-        """Initialize StatComponent with current_value defaulting to base_value."""
-        if "current_value" not in data and "base_value" in data:
-            data["current_value"] = data["base_value"]
-        super().__init__(**data)
+    __slots__ = ("_index",)
 
-    @field_validator("current_value")
-    @classmethod
-    def validate_current_value(cls, current_value: float, validation_info) -> float:
-        """Ensures current_value respects min_value and max_value constraints.
+    def __reduce_ex__(self, protocol: Any) -> Tuple[type, Tuple[List[Any]]]:
+        # Copies and pickles are plain lists; their component wraps them again on next use
+        return list, (list(self),)
 
-        Args:
-            current_value: The current value to validate.
-            validation_info: Validation context containing other field values.
+    def _mark_stale(self) -> None:
+        """Makes the component using this list rebuild its index on next use."""
+        index_state = self._index
+        if index_state.source is self:
+            index_state.source = None
 
-        Returns:
-            Validated current value, constrained within min/max bounds.
-        """
-        values = validation_info.data
-        min_val = values.get("min_value")
-        max_val = values.get("max_value")
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mark_stale()
 
-        if min_val is not None and current_value < min_val:
-            return min_val
-        if max_val is not None and current_value > max_val:
-            return max_val
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._mark_stale()
 
-        return current_value
+    def __iadd__(self, other: Iterable[Any]) -> Self:
+        result = super().__iadd__(other)
+        self._mark_stale()
+        return result
 
-    @field_validator("base_value")
-    @classmethod
-    def validate_base_value(cls, base_value: float, validation_info) -> float:
-        """Ensures base_value respects min_value and max_value constraints.
+    def __imul__(self, count: int) -> Self:
+        result = super().__imul__(count)
+        self._mark_stale()
+        return result
 
-        Args:
-            base_value: The base value to validate.
-            validation_info: Validation context containing other field values.
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._mark_stale()
 
-        Returns:
-            Validated base value, constrained within min/max bounds.
-        """
-        values = validation_info.data
-        min_val = values.get("min_value")
-        max_val = values.get("max_value")
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._mark_stale()
 
-        if min_val is not None and base_value < min_val:
-            return min_val
-        if max_val is not None and base_value > max_val:
-            return max_val
+    def insert(self, position: int, item: Any) -> None:
+        super().insert(position, item)
+        self._mark_stale()
 
-        return base_value
+    def pop(self, position: int = -1) -> Any:
+        item = super().pop(position)
+        self._mark_stale()
+        return item
 
-    def modify_value(self, modifier: float) -> float:
-        """Applies a modifier to the current value.
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._mark_stale()
 
-        Args:
-            modifier: The amount to add to the current value.
+    def clear(self) -> None:
+        super().clear()
+        self._mark_stale()
 
-        Returns:
-            The new current value after modification (constrained by min/max).
-        """
-        new_value = self.current_value + modifier
-        
-        # Apply constraints
-        if self.min_value is not None and new_value < self.min_value:
-            new_value = self.min_value
-        if self.max_value is not None and new_value > self.max_value:
-            new_value = self.max_value
-        
-        self.current_value = new_value
-        return self.current_value
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._mark_stale()
 
-    def reset_to_base(self) -> None:
-        """Resets the current value to the base value.
-        
-        Note: This will trigger validation automatically due to validate_assignment=True.
-        """
-        self.current_value = self.base_value
+    def reverse(self) -> None:
+        super().reverse()
+        self._mark_stale()
 
-    def set_base_value(self, new_value: float) -> float:
-        """Sets both base and current values to the new value.
 
-        Args:
-            new_value: The new value to set.
+class _StatNameIndex:
+    """Name lookup state of a StatsComponent.
 
-        Returns:
-            The new base value after setting (constrained by min/max).
-        """
-        # Apply constraints before setting
-        if self.min_value is not None and new_value < self.min_value:
-            new_value = self.min_value
-        if self.max_value is not None and new_value > self.max_value:
-            new_value = self.max_value
-        
-        self.base_value = new_value
-        self.current_value = new_value
-        return self.base_value
+    Shallow copies of the component share its stats list, so they also share
+    this object. Deep copies and unpickled components get a new one, which
+    starts out stale.
+
+    Attributes:
+        source: The stats list the index was built from, or None once stale.
+        positions: Stat name to the position of the first stat with that name.
+        renames: Value of _stat_renames when the index was built.
+    """
+
+    __slots__ = ("source", "positions", "renames")
+
+    def __init__(self) -> None:
+        self.source: Optional[_TrackedList] = None
+        self.positions: Dict[str, int] = {}
+        self.renames = 0
 
 
 class StatsComponent(ComponentModel):
@@ -347,6 +1079,11 @@ class StatsComponent(ComponentModel):
     Manages multiple StatComponent instances and provides high-level operations
     for adding, removing, and modifying statistics across the collection.
 
+    Lookups by name go through a private name-to-position index. Changing the
+    stats list in place or renaming a stat marks the index stale, and a stale
+    index, or one built from a different list than the current stats, is
+    rebuilt on next use.
+
     Attributes:
         stats: List of StatComponent instances.
         max_stats: Maximum number of stats in this collection (None for unlimited).
@@ -356,6 +1093,24 @@ class StatsComponent(ComponentModel):
     stats: List[StatComponent] = Field(default_factory=list, description="List of statistics")
     max_stats: Optional[int] = Field(default=None, ge=1, description="Maximum number of stats (None for unlimited)")
 
+    # A slot rather than a private attribute, so the index is left out of equality
+    __slots__ = ("_name_index",)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        """Creates a stats collection with a stale name index, built on first use.
+
+        Construction, model_construct(), deep copies and unpickling all go through here.
+        """
+        stats_component = super().__new__(cls)
+        object.__setattr__(stats_component, "_name_index", _StatNameIndex())
+        return stats_component
+
+    def __copy__(self) -> Self:
+        """Returns a shallow copy that shares the stats list and the name index with this collection."""
+        copied = super().__copy__()
+        object.__setattr__(copied, "_name_index", self._name_index)
+        return copied
+
     @model_validator(mode="after")
     def validate_stats_count(self) -> "StatsComponent":
         """Ensures stats count doesn't exceed max_stats.
@@ -364,9 +1119,111 @@ class StatsComponent(ComponentModel):
             The validated StatsComponent instance.
         """
         if self.max_stats is not None and len(self.stats) > self.max_stats:
-            self.stats = self.stats[:self.max_stats]
+            # Trimming keeps already-validated stats, so skip re-validating the list
+            object.__setattr__(self, "stats", self.stats[:self.max_stats])
+        return self
+
+    @model_validator(mode="after")
+    def build_name_index(self) -> "StatsComponent":
+        """Builds the name-to-position index from the stats list.
+
+        Returns:
+            The validated StatsComponent instance.
+        """
+        self._rebuild_name_index()
         return self
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "StatsComponent":
+        """Creates a StatsComponent from trusted data, skipping validation.
+
+        Intended for loading data that was produced by model_dump() of a valid
+        component, e.g. save games. No validators run, so the caller is
+        responsible for the data respecting min/max and max_stats constraints.
+
+        Args:
+            data: Dictionary with the StatsComponent fields; stats are dictionaries.
+
+        Returns:
+            The constructed StatsComponent instance.
+        """
+        stats = []
+        for stat_data in data.get("stats", ()):
+            if "current_value" not in stat_data and "base_value" in stat_data:
+                stat_data = {**stat_data, "current_value": stat_data["base_value"]}
+            stats.append(_construct_trusted(StatComponent, stat_data))
+
+        component = _construct_trusted(cls, {**data, "stats": stats})
+        component._rebuild_name_index()
+        return component
+
+    @classmethod
+    def from_data(cls, items: List[StatData], max_stats: Optional[int] = None) -> "StatsComponent":
+        """Creates a validated StatsComponent from runtime stat data.
+
+        Args:
+            items: StatData instances to convert, in order.
+            max_stats: Optional maximum number of stats.
+
+        Returns:
+            The created StatsComponent instance.
+        """
+        return cls(stats=[StatComponent.from_data(item) for item in items], max_stats=max_stats)
+
+    def to_data(self) -> List[StatData]:
+        """Converts all statistics to slotted runtime counterparts.
+
+        Hot loops that update many stats can work on the returned list and
+        convert back with from_data() when the result needs to be saved or shown.
+
+        Returns:
+            List of StatData instances in stats order.
+        """
+        return [stat.to_data() for stat in self.stats]
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuilds the name-to-position index, keeping the first stat for each name."""
+        stats = self.stats
+        index_state = self._name_index
+        if type(stats) is not _TrackedList or stats._index is not index_state:
+            # Wrap (or take over) the list so in-place changes reach this index
+            stats = _TrackedList(stats)
+            stats._index = index_state
+            object.__setattr__(self, "stats", stats)
+
+        positions: Dict[str, int] = {}
+        for i, stat in enumerate(stats):
+            positions.setdefault(stat.name, i)
+        index_state.source = stats
+        index_state.positions = positions
+        index_state.renames = _stat_renames
+
+    def _synced_name_index(self) -> Dict[str, int]:
+        """Returns the name-to-position index, rebuilding it first if it is stale.
+
+        Returns:
+            Dictionary mapping each stat name to the position of its first stat.
+        """
+        index_state = self._name_index
+        if index_state.source is not self.stats or index_state.renames != _stat_renames:
+            self._rebuild_name_index()
+        return index_state.positions
+
+    def _find_stat_index(self, name: str) -> Optional[int]:
+        """Finds the position of a statistic in the stats list.
+
+        Args:
+            name: Name of the statistic to find.
+
+        Returns:
+            Index of the statistic in the stats list, or None if not found.
+        """
+        # _synced_name_index() inlined
+        index_state = self._name_index
+        if index_state.source is not self.stats or index_state.renames != _stat_renames:
+            self._rebuild_name_index()
+        return index_state.positions.get(name)
+
     def add_stat(
         self,
         name: str,
@@ -395,8 +1252,7 @@ class StatsComponent(ComponentModel):
             ValueError: If stat with same name already exists and replace_if_exists is False.
         """
         # Check if stat already exists
-        existing_stat = self.get_stat(name)
-        if existing_stat is not None:
+        if self._find_stat_index(name) is not None:
             if replace_if_exists:
                 self.remove_stat(name)
             else:
@@ -406,7 +1262,69 @@ class StatsComponent(ComponentModel):
         if self.max_stats is not None and len(self.stats) >= self.max_stats:
             raise ValueError(f"Cannot add stat: maximum number of stats ({self.max_stats}) reached")
 
-        # Create new stat
+        new_stat = self._new_stat(name, base_value, current_value, min_value, max_value, description)
+        stats = self.stats
+        # Bypass _TrackedList.append, the index is updated here
+        list.append(stats, new_stat)
+        self._name_index.positions[new_stat.name] = len(stats) - 1
+        return new_stat
+
+    def add_stats_bulk(self, entries: Iterable[Mapping[str, Any]]) -> List[StatComponent]:
+        """Adds several new statistics at once.
+
+        All stats are created before any is added, so invalid input leaves the
+        collection unchanged.
+
+        Args:
+            entries: Keyword arguments for each stat, as accepted by add_stat
+                (without replace_if_exists).
+
+        Returns:
+            The created StatComponent instances, in order.
+
+        Raises:
+            ValueError: If a name is repeated or already exists, or the stats would
+                exceed max_stats.
+        """
+        new_stats = [self._new_stat(**entry) for entry in entries]
+
+        names = {stat.name for stat in new_stats}
+        if len(names) != len(new_stats):
+            raise ValueError("Stat names in a bulk add must be unique")
+        positions = self._synced_name_index()
+        for stat in new_stats:
+            if stat.name in positions:
+                raise ValueError(
+                    f"Stat with name '{stat.name}' already exists. Use replace_if_exists=True to replace it."
+                )
+
+        if self.max_stats is not None and len(self.stats) + len(new_stats) > self.max_stats:
+            raise ValueError(f"Cannot add stats: maximum number of stats ({self.max_stats}) reached")
+
+        stats = self.stats
+        start = len(stats)
+        # Bypass _TrackedList.extend, the index is updated here
+        list.extend(stats, new_stats)
+        positions.update((stat.name, start + i) for i, stat in enumerate(new_stats))
+        return new_stats
+
+    @staticmethod
+    def _new_stat(
+        name: str,
+        base_value: float = 0.0,
+        current_value: Optional[float] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        description: str = "",
+    ) -> StatComponent:
+        """Creates a stat for add_stat, skipping validation when the arguments allow it.
+
+        Returns:
+            The created StatComponent instance.
+        """
+        if _plain_stat_args(name, base_value, current_value, min_value, max_value, description):
+            return StatComponent._fast_new(name, base_value, current_value, min_value, max_value, description)
+
         stat_data = {
             "name": name,
             "base_value": base_value,
@@ -416,10 +1334,7 @@ class StatsComponent(ComponentModel):
         }
         if current_value is not None:
             stat_data["current_value"] = current_value
-
-        new_stat = StatComponent(**stat_data)
-        self.stats.append(new_stat)
-        return new_stat
+        return StatComponent(**stat_data)
 
     def remove_stat(self, name: str) -> bool:
         """Removes a statistic from the collection.
@@ -430,11 +1345,23 @@ class StatsComponent(ComponentModel):
         Returns:
             True if statistic was found and removed, False otherwise.
         """
-        for i, stat in enumerate(self.stats):
-            if stat.name == name:
-                del self.stats[i]
-                return True
-        return False
+        index = self._find_stat_index(name)
+        if index is None:
+            return False
+        stats = self.stats
+        # Bypass _TrackedList.__delitem__, the index is updated here
+        list.__delitem__(stats, index)
+        name_index = self._name_index.positions
+        del name_index[name]
+
+        # Only stats after the removed one moved; shift their first-occurrence entries
+        for position in range(index, len(stats)):
+            stat_name = stats[position].name
+            if name_index.get(stat_name) == position + 1:
+                name_index[stat_name] = position
+            elif stat_name == name and name not in name_index:
+                name_index[name] = position  # A later duplicate becomes the first one
+        return True
 
     def get_stat(self, name: str) -> Optional[StatComponent]:
         """Gets a statistic by name.
@@ -445,10 +1372,10 @@ class StatsComponent(ComponentModel):
         Returns:
             StatComponent instance if found, None otherwise.
         """
-        for stat in self.stats:
-            if stat.name == name:
-                return stat
-        return None
+        index = self._find_stat_index(name)
+        if index is None:
+            return None
+        return self.stats[index]
 
     def has_stat(self, name: str) -> bool:
         """Checks if a statistic with the given name exists.
@@ -459,7 +1386,7 @@ class StatsComponent(ComponentModel):
         Returns:
             True if statistic exists, False otherwise.
         """
-        return self.get_stat(name) is not None
+        return self._find_stat_index(name) is not None
 
     def modify_stat(self, name: str, modifier: float) -> Optional[float]:
         """Modifies the current value of a statistic.
@@ -525,7 +1452,42 @@ class StatsComponent(ComponentModel):
     def reset_all_to_base(self) -> None:
         """Resets all statistics' current values to their base values."""
         for stat in self.stats:
-            stat.reset_to_base()
+            # Plain assignment clamps and, for StatComponent itself, skips full validation
+            stat.current_value = stat.base_value
+
+    def modify_all(self, modifier: float) -> None:
+        """Applies the same modifier to the current value of every statistic.
+
+        Equivalent to calling modify_value on each stat, in a single pass.
+
+        Args:
+            modifier: The amount to add to each current value.
+        """
+        for stat in self.stats:
+            stat.current_value = stat.current_value + modifier
+
+    def apply_modifiers(self, modifiers: Mapping[str, float]) -> Dict[str, float]:
+        """Applies per-statistic modifiers in a single pass.
+
+        Intended for tick-based systems (regeneration, damage over time, auras)
+        that update many statistics at once.
+
+        Args:
+            modifiers: Mapping of statistic name to the amount to add to its current value.
+
+        Returns:
+            Mapping of statistic name to its new current value; names that are not
+            found are skipped.
+        """
+        results = {}
+        for name, modifier in modifiers.items():
+            index = self._find_stat_index(name)
+            if index is None:
+                continue
+            stat = self.stats[index]
+            stat.current_value = stat.current_value + modifier
+            results[name] = stat.current_value
+        return results
 
     def get_stat_names(self) -> List[str]:
         """Gets a list of all statistic names.
@@ -550,6 +1512,7 @@ class StatsComponent(ComponentModel):
             Number of statistics that were cleared.
         """
         count = len(self.stats)
+        # Marks the name index stale; rebuilding it for an empty list is cheap
         self.stats.clear()
         return count
 
@@ -575,6 +1538,63 @@ class InventoryCellComponent(ComponentModel):
     slot_type: Optional[str] = Field(default=None, description="Allowed item type for this slot")
     is_equipped: bool = Field(default=False, description="Whether this item is equipped")
 
+    # Weak references to the indexes of every inventory holding this cell. A slot
+    # rather than a private attribute, so it is left out of equality and copies.
+    __slots__ = ("_inventory_refs",)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        """Creates a cell that belongs to no inventory.
+
+        Construction, model_construct(), copies and unpickling all go through here.
+        """
+        cell = super().__new__(cls)
+        object.__setattr__(cell, "_inventory_refs", ())
+        return cell
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute and tells the owning inventories their indexes are stale."""
+        super().__setattr__(name, value)
+        if self._inventory_refs:
+            self._mark_inventories_stale()
+
+    def _mark_inventories_stale(self, keep: Optional["_InventoryIndex"] = None) -> None:
+        """Makes the inventories holding this cell rebuild their indexes on next use.
+
+        Args:
+            keep: Index the caller keeps up to date itself, left untouched.
+        """
+        for ref in self._inventory_refs:
+            index_state = ref()
+            if index_state is not None and index_state is not keep:
+                index_state.source = None
+
+    def _add_inventory_ref(self, index_state: "_InventoryIndex") -> None:
+        """Records that the inventory owning index_state holds this cell.
+
+        Args:
+            index_state: Index of the inventory adopting this cell.
+        """
+        refs = self._inventory_refs
+        for ref in refs:
+            if ref() is index_state:
+                return
+        # Drop references to inventories that no longer exist while at it
+        live_refs = tuple(ref for ref in refs if ref() is not None)
+        object.__setattr__(self, "_inventory_refs", live_refs + (weakref.ref(index_state),))
+
+    @field_validator("item_id")
+    @classmethod
+    def intern_item_id(cls, item_id: Optional[str]) -> Optional[str]:
+        """Interns the item identifier so equal ids share one string object.
+
+        Args:
+            item_id: The item identifier to intern.
+
+        Returns:
+            The interned item identifier, or None.
+        """
+        return None if item_id is None else _intern(item_id)
+
     @field_validator("quantity")
     @classmethod
     def validate_quantity(cls, quantity: int, validation_info) -> int:
@@ -638,25 +1658,36 @@ class InventoryCellComponent(ComponentModel):
         Returns:
             The number of items actually added (may be less due to stack limits).
         """
+        added = self._add_items(item_id, add_quantity)
+        if added and self._inventory_refs:
+            self._mark_inventories_stale()
+        return added
+
+    def _add_items(self, item_id: str, add_quantity: int) -> int:
+        """Same as add_items, without marking the owning inventories' indexes stale.
+
+        Used by InventoryComponent, which keeps its own indexes up to date and
+        marks those of any other inventory holding the cell.
+        """
         if add_quantity <= 0:
             return 0
 
-        # Check if we can add (different item in non-empty slot)
-        if not self.is_empty() and self.item_id != item_id:
+        quantity = self.quantity
+        current_item_id = self.item_id
+        # Check if we can add (different item in non-empty slot), is_empty() inlined
+        if quantity != 0 and current_item_id is not None and current_item_id != item_id:
             return 0  # Can't add different items to the same slot
 
-        available_space = self.max_stack_size - self.quantity
-        actual_add = min(add_quantity, available_space)
-        
-        # Update using model_copy with update to ensure proper validation
-        # This avoids validation errors when setting fields individually
-        updated_data = {
-            "item_id": item_id,
-            "quantity": self.quantity + actual_add,
-        }
-        updated = self.model_copy(update=updated_data)
-        # Copy all validated fields back to self
-        self.__dict__.update(updated.__dict__)
+        actual_add = min(add_quantity, self.max_stack_size - quantity)
+        if actual_add <= 0:
+            return 0
+
+        # The new state already satisfies the field invariants (0 < quantity <= max_stack_size
+        # with an item_id), so write it directly instead of re-running assignment validation
+        if current_item_id != item_id:
+            # Starting a new stack; keep stored ids interned like the field validator does
+            object.__setattr__(self, "item_id", _intern(item_id))
+        object.__setattr__(self, "quantity", quantity + actual_add)
 
         return actual_add
 
@@ -669,20 +1700,29 @@ class InventoryCellComponent(ComponentModel):
         Returns:
             The number of items actually removed.
         """
-        if remove_quantity <= 0 or self.is_empty():
+        removed = self._remove_items(remove_quantity)
+        if removed and self._inventory_refs:
+            self._mark_inventories_stale()
+        return removed
+
+    def _remove_items(self, remove_quantity: int) -> int:
+        """Same as remove_items, without marking the owning inventories' indexes stale.
+
+        Used by InventoryComponent, which keeps its own indexes up to date and
+        marks those of any other inventory holding the cell.
+        """
+        quantity = self.quantity
+        # is_empty() inlined
+        if remove_quantity <= 0 or quantity == 0 or self.item_id is None:
             return 0
 
-        actual_remove = min(remove_quantity, self.quantity)
-        new_quantity = self.quantity - actual_remove
-        
-        # Update using model_copy with update to ensure proper validation
-        updated_data = {"quantity": new_quantity}
+        actual_remove = min(remove_quantity, quantity)
+        new_quantity = quantity - actual_remove
+
+        # 0 <= new_quantity < quantity, so only the item_id/quantity invariant needs upkeep
+        object.__setattr__(self, "quantity", new_quantity)
         if new_quantity == 0:
-            updated_data["item_id"] = None
-        
-        updated = self.model_copy(update=updated_data)
-        # Copy all validated fields back to self
-        self.__dict__.update(updated.__dict__)
+            object.__setattr__(self, "item_id", None)
 
         return actual_remove
 
@@ -693,11 +1733,88 @@ class InventoryCellComponent(ComponentModel):
             The number of items that were in the cell before clearing.
         """
         previous_quantity = self.quantity
-        # Set quantity to 0 first to avoid validation error
-        self.quantity = 0
-        self.item_id = None
+        # An empty cell is always valid, so skip assignment validation
+        object.__setattr__(self, "quantity", 0)
+        object.__setattr__(self, "item_id", None)
+        if self._inventory_refs:
+            self._mark_inventories_stale()
         return previous_quantity
 
+    @classmethod
+    def from_data(cls, data: CellData) -> "InventoryCellComponent":
+        """Creates a validated InventoryCellComponent from its runtime counterpart.
+
+        Args:
+            data: CellData instance to convert.
+
+        Returns:
+            The created InventoryCellComponent instance.
+        """
+        cell = cls(max_stack_size=data.max_stack_size, slot_type=data.slot_type, is_equipped=data.is_equipped)
+        if data.item_id is not None:
+            cell.add_items(data.item_id, data.quantity)
+        return cell
+
+    def to_data(self) -> CellData:
+        """Converts this cell to its lightweight runtime counterpart.
+
+        Returns:
+            CellData instance with the same field values.
+        """
+        return CellData(
+            item_id=self.item_id,
+            quantity=self.quantity,
+            max_stack_size=self.max_stack_size,
+            slot_type=self.slot_type,
+            is_equipped=self.is_equipped,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the cell to a dictionary without a Pydantic schema walk.
+
+        Returns the same structure as model_dump(); extra fields are copied as-is
+        rather than dumped recursively.
+
+        Returns:
+            Dictionary with the cell fields followed by any extra fields.
+        """
+        data = {
+            "component_type": self.component_type,
+            "item_id": self.item_id,
+            "quantity": self.quantity,
+            "max_stack_size": self.max_stack_size,
+            "slot_type": self.slot_type,
+            "is_equipped": self.is_equipped,
+        }
+        if self.__pydantic_extra__:
+            data.update(self.__pydantic_extra__)
+        return data
+
+
+class _InventoryIndex:
+    """Item lookup state of an InventoryComponent.
+
+    Shallow copies of the inventory share its cells list, so they also share
+    this object and keep updating the same indexes. Deep copies and unpickled
+    inventories get a new one, which starts out stale.
+
+    Attributes:
+        source: The cells list the indexes were built from, or None once stale.
+        cells_by_item: item_id to ascending positions of the cells holding it.
+        empty_cells: Heap of empty cell positions.
+        qty_by_item: item_id to total quantity held.
+        non_full_cells: Number of cells below their max stack size.
+    """
+
+    __slots__ = ("source", "cells_by_item", "empty_cells", "qty_by_item", "non_full_cells", "__weakref__")
+
+    def __init__(self) -> None:
+        self.source: Optional[_TrackedList] = None
+        self.cells_by_item: Dict[str, List[int]] = {}
+        self.empty_cells: List[int] = []
+        self.qty_by_item: Dict[str, int] = {}
+        self.non_full_cells = 0
+
 
 class InventoryComponent(ComponentModel):
     """Component representing a full inventory with multiple cells.
@@ -705,6 +1822,15 @@ class InventoryComponent(ComponentModel):
     Manages a collection of inventory cells and provides high-level operations
     for adding, removing, and checking items across the entire inventory.
 
+    Item lookups go through private indexes (item_id to cell positions, item_id
+    to total quantity, a heap of empty cell positions and a count of cells that
+    are not full). The methods of this class keep them up to date. Cells and
+    the cells list mark them stale when changed directly, and a stale index, or
+    one built from a different list than the current cells, is rebuilt on next
+    use. The indexes live in one shared object, so shallow copies made with
+    model_copy() stay in step with the original. A cell may be held by several
+    inventories; changing it through one marks the indexes of the others stale.
+
     Attributes:
         cells: List of inventory cells that can hold items.
         max_cells: Maximum number of cells in this inventory.
@@ -716,6 +1842,24 @@ class InventoryComponent(ComponentModel):
     max_cells: int = Field(default=10, ge=1, description="Maximum number of cells in inventory")
     default_max_stack_size: int = Field(default=1, ge=1, description="Default max stack size for new cells")
 
+    # A slot rather than a private attribute, so the index is left out of equality
+    __slots__ = ("_index",)
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        """Creates an inventory with a stale index, built on first use.
+
+        Construction, model_construct(), deep copies and unpickling all go through here.
+        """
+        inventory = super().__new__(cls)
+        object.__setattr__(inventory, "_index", _InventoryIndex())
+        return inventory
+
+    def __copy__(self) -> Self:
+        """Returns a shallow copy that shares the cells list and the index with this inventory."""
+        copied = super().__copy__()
+        object.__setattr__(copied, "_index", self._index)
+        return copied
+
     @model_validator(mode="after")
     def validate_cells_count(self) -> "InventoryComponent":
         """Ensures cells count doesn't exceed max_cells.
@@ -724,9 +1868,115 @@ class InventoryComponent(ComponentModel):
             The validated InventoryComponent instance.
         """
         if len(self.cells) > self.max_cells:
-            self.cells = self.cells[:self.max_cells]
+            # Trimming keeps already-validated cells, so skip re-validating the list
+            object.__setattr__(self, "cells", self.cells[:self.max_cells])
+        return self
+
+    @model_validator(mode="after")
+    def build_item_index(self) -> "InventoryComponent":
+        """Builds the item and empty-cell indexes from the cells list.
+
+        Returns:
+            The validated InventoryComponent instance.
+        """
+        self.rebuild_index()
         return self
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "InventoryComponent":
+        """Creates an InventoryComponent from trusted data, skipping validation.
+
+        Intended for loading data that was produced by model_dump() of a valid
+        component, e.g. save games. No validators run, so the caller is
+        responsible for the data respecting stack size and max_cells constraints.
+
+        Args:
+            data: Dictionary with the InventoryComponent fields; cells are dictionaries.
+
+        Returns:
+            The constructed InventoryComponent instance.
+        """
+        cells = []
+        for cell_data in data.get("cells", ()):
+            if cell_data.get("item_id") is not None:
+                # Validators are skipped, so intern here to keep ids shared between cells
+                cell_data = {**cell_data, "item_id": _intern(cell_data["item_id"])}
+            cells.append(_construct_trusted(InventoryCellComponent, cell_data))
+
+        component = _construct_trusted(cls, {**data, "cells": cells})
+        component.rebuild_index()
+        return component
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializes the inventory to a dictionary without a Pydantic schema walk.
+
+        Meant for frequent saves. Returns the same structure as model_dump(),
+        including empty cells so cell positions survive; extra fields are
+        copied as-is rather than dumped recursively. Load the result with
+        from_trusted().
+
+        Returns:
+            Dictionary with the inventory fields followed by any extra fields.
+        """
+        data = {
+            "component_type": self.component_type,
+            "cells": [cell.to_dict() for cell in self.cells],
+            "max_cells": self.max_cells,
+            "default_max_stack_size": self.default_max_stack_size,
+        }
+        if self.__pydantic_extra__:
+            data.update(self.__pydantic_extra__)
+        return data
+
+    def rebuild_index(self) -> None:
+        """Rebuilds the item and empty-cell indexes from the current cells.
+
+        The inventory methods call this themselves when the indexes are stale,
+        so calling it directly is never required.
+        """
+        cells = self.cells
+        index_state = self._index
+        if type(cells) is not _TrackedList or cells._index is not index_state:
+            # Wrap (or take over) the list so in-place changes reach these indexes
+            cells = _TrackedList(cells)
+            cells._index = index_state
+            object.__setattr__(self, "cells", cells)
+
+        cells_by_item: Dict[str, List[int]] = {}
+        empty_cells: List[int] = []
+        qty_by_item: Dict[str, int] = {}
+        non_full_cells = 0
+        # Cell state is compared inline rather than through is_empty()/is_full()
+        for index, cell in enumerate(cells):
+            cell._add_inventory_ref(index_state)
+            item_id = cell.item_id
+            quantity = cell.quantity
+            if quantity < cell.max_stack_size:
+                non_full_cells += 1
+            if quantity == 0 or item_id is None:
+                empty_cells.append(index)
+            else:
+                cells_by_item.setdefault(item_id, []).append(index)
+                qty_by_item[item_id] = qty_by_item.get(item_id, 0) + quantity
+        # Indexes are collected in ascending order, which is already a valid heap
+        index_state.source = cells
+        index_state.cells_by_item = cells_by_item
+        index_state.empty_cells = empty_cells
+        index_state.qty_by_item.clear()
+        index_state.qty_by_item.update(qty_by_item)
+        index_state.non_full_cells = non_full_cells
+
+    def _synced_index(self) -> _InventoryIndex:
+        """Returns the index state, rebuilding it first if it is stale.
+
+        Returns:
+            The _InventoryIndex of this inventory.
+        """
+        index_state = self._index
+        if index_state.source is not self.cells:
+            self.rebuild_index()
+        return index_state
+
     def add_item(self, item_id: str, quantity: int = 1, max_stack_size: Optional[int] = None) -> int:
         """Adds items to the inventory.
 
@@ -744,41 +1994,102 @@ class InventoryComponent(ComponentModel):
         if quantity <= 0:
             return 0
 
-        remaining_quantity = quantity
+        item_id = _intern(item_id)
 
-        # First, try to add to existing cells with the same item
-        for cell in self.cells:
-            if not cell.is_empty() and cell.item_id == item_id:
-                added = cell.add_items(item_id, remaining_quantity)
-                remaining_quantity -= added
-                if remaining_quantity <= 0:
-                    return quantity
-
-        # Then, try to add to empty cells
-        while remaining_quantity > 0:
-            # Find an empty cell
-            empty_cell = None
-            for cell in self.cells:
-                if cell.is_empty():
-                    empty_cell = cell
+        remaining_quantity = quantity
+        # _synced_index() inlined
+        index_state = self._index
+        if index_state.source is not self.cells:
+            self.rebuild_index()
+        cells = self.cells
+        cells_by_item = index_state.cells_by_item
+        empty_cells = index_state.empty_cells
+        non_full_cells = index_state.non_full_cells
+
+        item_cells = cells_by_item.get(item_id, [])
+        try:
+            # First, try to add to existing cells with the same item
+            for index in item_cells:
+                cell = cells[index]
+                if cell.quantity < cell.max_stack_size:
+                    remaining_quantity -= cell._add_items(item_id, remaining_quantity)
+                    if len(cell._inventory_refs) > 1:
+                        cell._mark_inventories_stale(index_state)
+                    if cell.quantity >= cell.max_stack_size:
+                        non_full_cells -= 1
+                    if remaining_quantity <= 0:
+                        break
+
+            # Then, try to add to empty cells, lowest position first
+            while remaining_quantity > 0:
+                if empty_cells:
+                    index = heapq.heappop(empty_cells)
+                    empty_cell = cells[index]
+                elif len(cells) < self.max_cells:
+                    # No empty cell exists but we can create a new one
+                    stack_size = max_stack_size if max_stack_size is not None else self.default_max_stack_size
+                    empty_cell = InventoryCellComponent(max_stack_size=stack_size)
+                    empty_cell._add_inventory_ref(index_state)
+                    # Bypass _TrackedList.append, the indexes are updated here
+                    list.append(cells, empty_cell)
+                    non_full_cells += 1
+                    index = len(cells) - 1
+                else:
+                    # No more space available
                     break
 
-            # If no empty cell exists and we can create new cells, create one
-            if empty_cell is None and len(self.cells) < self.max_cells:
-                stack_size = max_stack_size if max_stack_size is not None else self.default_max_stack_size
-                new_cell = InventoryCellComponent(max_stack_size=stack_size)
-                self.cells.append(new_cell)
-                empty_cell = new_cell
-
-            # If we have an empty cell, add items to it
-            if empty_cell is not None:
-                added = empty_cell.add_items(item_id, remaining_quantity)
-                remaining_quantity -= added
-            else:
-                # No more space available
-                break
+                remaining_quantity -= empty_cell._add_items(item_id, remaining_quantity)
+                if len(empty_cell._inventory_refs) > 1:
+                    empty_cell._mark_inventories_stale(index_state)
+                if empty_cell.quantity >= empty_cell.max_stack_size:
+                    non_full_cells -= 1
+                bisect.insort(item_cells, index)
+        except BaseException:
+            # Cells may already hold part of the items, e.g. when creating a new cell
+            # fails validation; rebuild the indexes on next use
+            index_state.source = None
+            raise
+
+        if item_cells and item_id not in cells_by_item:
+            cells_by_item[item_id] = item_cells
+        index_state.non_full_cells = non_full_cells
+
+        added_total = quantity - remaining_quantity
+        if added_total:
+            qty_by_item = index_state.qty_by_item
+            qty_by_item[item_id] = qty_by_item.get(item_id, 0) + added_total
+        return added_total
+
+    def add_items(self, items: Iterable[Tuple[str, int]], max_stack_size: Optional[int] = None) -> List[int]:
+        """Adds several items to the inventory at once.
+
+        Quantities of the same item are combined and added with one add_item
+        call per item, in order of first appearance. When space runs out this
+        can place items differently than calling add_item for each pair in turn.
+
+        Args:
+            items: Pairs of (item_id, quantity) to add.
+            max_stack_size: Optional max stack size for new cells (uses default if not provided).
 
-        return quantity - remaining_quantity
+        Returns:
+            The number of items actually added for each pair, in input order. When
+            an item only partly fits, earlier pairs for that item are filled first.
+        """
+        pairs = list(items)
+        totals: Dict[str, int] = {}
+        for item_id, quantity in pairs:
+            if quantity > 0:
+                totals[item_id] = totals.get(item_id, 0) + quantity
+
+        added = {item_id: self.add_item(item_id, total, max_stack_size) for item_id, total in totals.items()}
+
+        results = []
+        for item_id, quantity in pairs:
+            share = min(quantity, added[item_id]) if quantity > 0 else 0
+            if share:
+                added[item_id] -= share
+            results.append(share)
+        return results
 
     def remove_item(self, item_id: str, quantity: int = 1) -> int:
         """Removes items from the inventory.
@@ -796,21 +2107,67 @@ class InventoryComponent(ComponentModel):
         if quantity <= 0:
             return 0
 
+        # _synced_index() inlined
+        index_state = self._index
+        if index_state.source is not self.cells:
+            self.rebuild_index()
+        cells_by_item = index_state.cells_by_item
+        item_cells = cells_by_item.get(item_id)
+        if not item_cells:
+            return 0
+
         remaining_to_remove = quantity
+        emptied = 0
+        cells = self.cells
+        empty_cells = index_state.empty_cells
+        refilled = 0
 
         # Remove from cells containing this item
-        for cell in self.cells:
-            if not cell.is_empty() and cell.item_id == item_id:
-                removed = cell.remove_items(remaining_to_remove)
-                remaining_to_remove -= removed
-                if remaining_to_remove <= 0:
-                    return quantity
+        for index in item_cells:
+            cell = cells[index]
+            was_full = cell.quantity >= cell.max_stack_size
+            removed = cell._remove_items(remaining_to_remove)
+            if len(cell._inventory_refs) > 1:
+                cell._mark_inventories_stale(index_state)
+            remaining_to_remove -= removed
+            if was_full and removed:
+                refilled += 1
+            # Indexed cells always hold an item, so running out of quantity means empty
+            if cell.quantity == 0:
+                heapq.heappush(empty_cells, index)
+                emptied += 1
+            if remaining_to_remove <= 0:
+                break
+
+        index_state.non_full_cells += refilled
+
+        # Cells are drained front to back, so emptied cells are a prefix
+        del item_cells[:emptied]
+        if not item_cells:
+            del cells_by_item[item_id]
+            del index_state.qty_by_item[item_id]
+            return quantity - remaining_to_remove
 
-        return quantity - remaining_to_remove
+        removed_total = quantity - remaining_to_remove
+        index_state.qty_by_item[item_id] -= removed_total
+        return removed_total
+
+    @property
+    def counts(self) -> Mapping[str, int]:
+        """Read-only view of the total quantity held for each item_id.
+
+        The view follows later changes made through the inventory; changes
+        made to cells directly show up once the inventory is next used. This
+        makes it the cheaper choice when checking many items at once, e.g.
+        every ingredient of a recipe.
+        """
+        return MappingProxyType(self._synced_index().qty_by_item)
 
     def has_item(self, item_id: str, quantity: int = 1) -> bool:
         """Checks if the inventory contains at least the specified quantity of an item.
 
+        Use counts when checking several items in one go.
+
         Args:
             item_id: The identifier of the item to check.
             quantity: The minimum quantity to check for (default: 1).
@@ -821,29 +2178,40 @@ class InventoryComponent(ComponentModel):
         if quantity <= 0:
             return True
 
-        total_quantity = 0
-        for cell in self.cells:
-            if not cell.is_empty() and cell.item_id == item_id:
-                total_quantity += cell.quantity
-                if total_quantity >= quantity:
-                    return True
-
-        return False
+        # _synced_index() inlined
+        index_state = self._index
+        if index_state.source is not self.cells:
+            self.rebuild_index()
+        return index_state.qty_by_item.get(item_id, 0) >= quantity
 
     def get_item_count(self, item_id: str) -> int:
         """Gets the total quantity of a specific item in the inventory.
 
+        Use counts when reading the totals of several items in one go.
+
         Args:
             item_id: The identifier of the item to count.
 
         Returns:
             The total quantity of the item across all cells.
         """
-        total = 0
-        for cell in self.cells:
-            if not cell.is_empty() and cell.item_id == item_id:
-                total += cell.quantity
-        return total
+        # _synced_index() inlined
+        index_state = self._index
+        if index_state.source is not self.cells:
+            self.rebuild_index()
+        return index_state.qty_by_item.get(item_id, 0)
+
+    def get_item_counts(self, item_ids: Iterable[str]) -> Dict[str, int]:
+        """Gets the total quantity of several items in the inventory.
+
+        Args:
+            item_ids: The identifiers of the items to count.
+
+        Returns:
+            Dictionary mapping each requested item_id to its total quantity (0 if absent).
+        """
+        qty_by_item = self._synced_index().qty_by_item
+        return {item_id: qty_by_item.get(item_id, 0) for item_id in item_ids}
 
     def get_empty_cells_count(self) -> int:
         """Gets the number of empty cells in the inventory.
@@ -851,7 +2219,7 @@ class InventoryComponent(ComponentModel):
         Returns:
             The number of empty cells.
         """
-        return sum(1 for cell in self.cells if cell.is_empty())
+        return len(self._synced_index().empty_cells)
 
     def is_full(self) -> bool:
         """Checks if the inventory is full (all cells are occupied and at max capacity).
@@ -859,16 +2227,21 @@ class InventoryComponent(ComponentModel):
         Returns:
             True if all cells are full, False otherwise.
         """
-        if len(self.cells) < self.max_cells:
-            return False
-
-        for cell in self.cells:
-            if not cell.is_full():
-                return False
-
-        return True
+        return len(self.cells) >= self.max_cells and self._synced_index().non_full_cells == 0
 
     def clear_all(self) -> None:
         """Clears all cells in the inventory."""
-        for cell in self.cells:
-            cell.clear_slot()
+        index_state = self._synced_index()
+        cells = self.cells
+        for cell in cells:
+            # Same writes as clear_slot(), without a method call per cell
+            object.__setattr__(cell, "quantity", 0)
+            object.__setattr__(cell, "item_id", None)
+            if len(cell._inventory_refs) > 1:
+                cell._mark_inventories_stale(index_state)
+        # Every cell is now empty and, with max_stack_size >= 1, not full
+        index_state.cells_by_item = {}
+        # Cleared in place so views returned by counts stay current
+        index_state.qty_by_item.clear()
+        index_state.empty_cells = list(range(len(cells)))
+        index_state.non_full_cells = len(cells)
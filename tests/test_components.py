@@ -7,6 +7,9 @@ This module contains comprehensive tests for:
 - InventoryCellComponent
 """
 
+import pickle
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -18,6 +21,8 @@ from arcaneweaver.core.entity_system.components import (
     InventoryComponent,
     ComponentType,
     FieldType,
+    StatData,
+    CellData,
 )
 
 
@@ -34,6 +39,11 @@ class TestFieldType:
         assert FieldType.SELECT.value == "select"
         assert FieldType.TEXTAREA.value == "textarea"
 
+    def test_field_type_is_string(self):
+        """Test that FieldType members are plain strings."""
+        assert FieldType.NUMBER == "number"
+        assert isinstance(FieldType.TEXT, str)
+
 
 class TestComponentType:
     """Tests for ComponentType enum."""
@@ -44,6 +54,11 @@ class TestComponentType:
         assert ComponentType.INVENTORY.value == "inventory"
         assert ComponentType.CUSTOM.value == "custom"
 
+    def test_component_type_is_string(self):
+        """Test that ComponentType members are plain strings."""
+        assert ComponentType.STAT == "stat"
+        assert StatComponent(name="strength").model_dump_json().count('"component_type":"stat"') == 1
+
 
 class TestComponentModel:
     """Tests for ComponentModel base class."""
@@ -82,6 +97,52 @@ class TestComponentModel:
         assert config["dynamic_field"]["type"] == FieldType.TEXT
         assert config["number_field"]["type"] == FieldType.NUMBER
 
+    def test_get_editor_config_is_isolated_between_calls(self):
+        """Test mutating a returned editor config does not leak into later calls."""
+        stat = StatComponent(name="strength", base_value=10.0)
+        config = stat.get_editor_config()
+        config["name"]["label"] = "Changed"
+        config.pop("base_value")
+
+        fresh = StatComponent(name="agility").get_editor_config()
+        assert fresh["name"]["label"] == "Name"
+        assert "base_value" in fresh
+
+    def test_iter_editor_config(self):
+        """Test iter_editor_config yields the same entries as get_editor_config."""
+        stat = StatComponent(name="strength", base_value=10.0, custom_metadata="test")
+        entries = list(stat.iter_editor_config())
+        assert [name for name, _ in entries][-1] == "custom_metadata"
+        assert dict(entries) == stat.get_editor_config()
+
+    def test_infer_field_type(self):
+        """Test _infer_field_type for different field annotations."""
+        from typing import Dict, List, Optional
+        from pydantic.fields import FieldInfo
+
+        component = ComponentModel()
+
+        assert component._infer_field_type(FieldInfo(annotation=int)) == FieldType.NUMBER
+        assert component._infer_field_type(FieldInfo(annotation=str)) == FieldType.TEXT
+        assert component._infer_field_type(FieldInfo(annotation=bool)) == FieldType.CHECKBOX
+        assert component._infer_field_type(FieldInfo(annotation=List[int])) == FieldType.LIST
+        assert component._infer_field_type(FieldInfo(annotation=Dict[str, int])) == FieldType.OBJECT
+        assert component._infer_field_type(FieldInfo(annotation=Optional[float])) == FieldType.NUMBER
+        assert component._infer_field_type(FieldInfo(annotation=Optional[bool])) == FieldType.CHECKBOX
+        assert component._infer_field_type(FieldInfo(annotation=bytes)) == FieldType.TEXT  # Default for unknown
+
+    def test_subclass_with_unhashable_annotation_metadata(self):
+        """Test components whose annotations carry unhashable metadata still get an editor config."""
+        from typing import Annotated, Dict, List
+
+        class TaggedComponent(ComponentModel):
+            tags: List[Annotated[int, {"ge": 0}]] = []
+            levels: Dict[str, Annotated[int, {"ge": 0}]] = {}
+
+        config = TaggedComponent().get_editor_config()
+        assert config["tags"]["type"] == FieldType.LIST
+        assert config["levels"]["type"] == FieldType.OBJECT
+
     def test_infer_value_type(self):
         """Test _infer_value_type for different value types."""
         component = ComponentModel()
@@ -94,6 +155,24 @@ class TestComponentModel:
         assert component._infer_value_type({"key": "value"}) == FieldType.OBJECT
         assert component._infer_value_type(None) == FieldType.TEXT  # Default for unknown
 
+    def test_infer_value_type_subclasses(self):
+        """Test _infer_value_type still classifies subclasses of builtin types."""
+        from collections import OrderedDict
+        from enum import IntEnum
+
+        class Level(IntEnum):
+            LOW = 1
+
+        component = ComponentModel()
+        assert component._infer_value_type(Level.LOW) == FieldType.NUMBER
+        assert component._infer_value_type(OrderedDict(a=1)) == FieldType.OBJECT
+
+    def test_extra_field_config_is_isolated_between_calls(self):
+        """Test mutating an extra field's config does not leak into other components."""
+        config = ComponentModel(power=1).get_editor_config()
+        config["power"]["label"] = "Changed"
+        assert ComponentModel(power=2).get_editor_config()["power"]["label"] == "Power"
+
 
 class TestStatComponent:
     """Tests for StatComponent."""
@@ -174,6 +253,77 @@ class TestStatComponent:
         stat.base_value = 150.0
         assert stat.base_value == 100.0  # Should be clamped to max_value
 
+    def test_stat_component_int_assignment_is_float(self):
+        """Test that assigning an int value stores a clamped float."""
+        stat = StatComponent(name="health", base_value=10.0, min_value=0.0, max_value=100.0)
+        stat.current_value = 150
+        assert stat.current_value == 100.0
+        assert type(stat.current_value) is float
+
+    def test_stat_component_other_assignments_still_validated(self):
+        """Test that non-numeric values and other fields keep assignment validation."""
+        stat = StatComponent(name="health", base_value=10.0, min_value=0.0, max_value=100.0)
+        stat.current_value = "150"
+        assert stat.current_value == 100.0
+        with pytest.raises(ValidationError):
+            stat.base_value = "lots"
+        with pytest.raises(ValidationError):
+            stat.min_value = "none"
+
+    def test_stat_component_subclass_checks_kept_on_assignment(self):
+        """Test frozen subclasses and subclass validators still apply to value assignments."""
+        from pydantic import ConfigDict, field_validator
+
+        class FrozenStat(StatComponent):
+            model_config = ConfigDict(frozen=True)
+
+        class CappedStat(StatComponent):
+            @field_validator("current_value")
+            @classmethod
+            def cap(cls, value: float) -> float:
+                return min(value, 3.0)
+
+        class PlainStat(StatComponent):
+            pass
+
+        frozen = FrozenStat(name="x")
+        with pytest.raises(ValidationError):
+            frozen.current_value = 5
+        with pytest.raises(ValidationError):
+            frozen.modify_value(3)
+
+        capped = CappedStat(name="x")
+        capped.current_value = 9
+        assert capped.current_value == 3.0
+
+        plain = PlainStat(name="x", min_value=0.0)
+        plain.current_value = -1
+        assert plain.current_value == 0.0
+        assert PlainStat._fast_assign_fields == StatComponent._fast_assign_fields
+
+    def test_stat_component_methods_clamp_without_assignment_validation(self):
+        """Test modify_value and set_base_value clamp for subclasses that skip assignment validation."""
+        from pydantic import ConfigDict
+
+        class UncheckedStat(StatComponent):
+            model_config = ConfigDict(validate_assignment=False)
+
+        stat = UncheckedStat(name="x", base_value=50.0, min_value=0.0, max_value=100.0)
+        assert stat.modify_value(80) == 100.0
+        assert stat.modify_value(-500) == 0.0
+        assert stat.set_base_value(500) == 100.0
+        assert stat.current_value == 100.0
+        assert stat.set_base_value(-5) == 0.0
+        assert stat.current_value == 0.0
+
+    def test_stat_component_nan_passes_through(self):
+        """Test that NaN values are not clamped, bounded or not."""
+        import math
+
+        assert math.isnan(StatComponent(name="x", base_value=float("nan")).base_value)
+        stat = StatComponent(name="health", base_value=10.0, min_value=0.0, max_value=100.0)
+        assert math.isnan(stat.modify_value(float("nan")))
+
     def test_modify_value_increase(self):
         """Test modify_value increases current value."""
         stat = StatComponent(name="strength", base_value=10.0)
@@ -265,6 +415,12 @@ class TestStatComponent:
         )
         assert stat.description == "Mental acuity and reasoning"
 
+    def test_stat_component_name_is_interned(self):
+        """Test that equal stat names share one string object."""
+        first = StatComponent(name="".join(["str", "ength"]))
+        second = StatComponent(name="".join(["stren", "gth"]))
+        assert first.name is second.name
+
     def test_stat_component_extra_fields(self):
         """Test StatComponent accepts extra fields."""
         stat = StatComponent(
@@ -278,6 +434,23 @@ class TestStatComponent:
 class TestStatsComponent:
     """Tests for StatsComponent (collection of statistics)."""
 
+    def test_apply_modifiers_marks_current_value_set(self):
+        """Test apply_modifiers changes survive model_dump(exclude_unset=True)."""
+        stats = StatsComponent(stats=[StatComponent(name="x")])
+        stats.apply_modifiers({"x": 5.0})
+        assert stats.model_dump(exclude_unset=True)["stats"][0]["current_value"] == 5.0
+
+    def test_bulk_updates_mark_current_value_set(self):
+        """Test modify_all and reset_all_to_base survive model_dump(exclude_unset=True)."""
+        stats = StatsComponent(stats=[StatComponent(name="x")])
+        stats.modify_all(5)
+        assert stats.model_dump(exclude_unset=True)["stats"][0]["current_value"] == 5.0
+
+        stats = StatsComponent(stats=[StatComponent(name="x", base_value=2.0)])
+        stats.stats[0].model_fields_set.discard("current_value")
+        stats.reset_all_to_base()
+        assert stats.model_dump(exclude_unset=True)["stats"][0]["current_value"] == 2.0
+
     def test_stats_component_basic_creation(self):
         """Test basic StatsComponent creation."""
         stats = StatsComponent()
@@ -290,6 +463,16 @@ class TestStatsComponent:
         stats = StatsComponent(max_stats=5)
         assert stats.max_stats == 5
 
+    def test_stats_component_trims_to_max_stats(self):
+        """Test stats beyond max_stats are dropped and lookups stay consistent."""
+        stats = StatsComponent(
+            max_stats=2,
+            stats=[StatComponent(name=name) for name in ("strength", "agility", "health")],
+        )
+        assert stats.get_stat_names() == ["strength", "agility"]
+        assert stats.has_stat("health") is False
+        assert stats.get_stat("agility") is stats.stats[1]
+
     def test_add_stat_basic(self):
         """Test adding a statistic."""
         stats = StatsComponent()
@@ -317,6 +500,19 @@ class TestStatsComponent:
         assert stat.max_value == 100.0
         assert stat.description == "Current health"
 
+    def test_add_stat_matches_validated_stat(self):
+        """Test add_stat builds the same stat as the validating constructor."""
+        stats = StatsComponent()
+        for kwargs in (
+            {"name": "hp", "base_value": 150, "min_value": 0, "max_value": 100},
+            {"name": "mp", "base_value": 5.0, "current_value": "7", "description": "Mana"},
+        ):
+            stat = stats.add_stat(**kwargs)
+            expected = StatComponent(**kwargs)
+            assert stat.model_dump() == expected.model_dump()
+        with pytest.raises(ValidationError):
+            stats.add_stat("bad", base_value="many")
+
     def test_add_stat_duplicate_name_raises_error(self):
         """Test adding stat with duplicate name raises error."""
         stats = StatsComponent()
@@ -340,6 +536,92 @@ class TestStatsComponent:
         with pytest.raises(ValueError, match="maximum number of stats"):
             stats.add_stat("stat3", 10.0)
 
+    def test_lookups_follow_direct_list_changes(self):
+        """Test lookups find stats placed into the list directly."""
+        stats = StatsComponent()
+        stats.add_stat("a", 1.0)
+        stats.add_stat("b", 2.0)
+        stats.stats[0] = StatComponent(name="c", base_value=3.0)
+        assert stats.has_stat("c") is True
+        assert stats.get_stat("c").base_value == 3.0
+        assert stats.get_stat("a") is None
+        with pytest.raises(ValueError, match="already exists"):
+            stats.add_stat("c")
+
+        stats.stats.append(StatComponent(name="d"))
+        assert stats.modify_stat("d", 4.0) == 4.0
+
+    def test_lookups_follow_renamed_stats(self):
+        """Test lookups follow a stat renamed by assignment."""
+        stats = StatsComponent()
+        stats.add_stat("a", 1.0)
+        stats.add_stat("b", 2.0)
+        stats.stats[1].name = "c"
+        assert stats.has_stat("b") is False
+        assert stats.get_stat("c").base_value == 2.0
+        stats.add_stat("b", 5.0)
+        assert stats.get_stat("b").base_value == 5.0
+
+    def test_lookups_after_copies(self):
+        """Test shallow copies share lookups and deep copies stay independent and equal."""
+        stats = StatsComponent()
+        stats.add_stat("a", 1.0)
+        shallow = stats.model_copy()
+        shallow.add_stat("b", 2.0)
+        assert stats.get_stat("b").base_value == 2.0
+        deep = stats.model_copy(deep=True)
+        assert deep == stats
+        deep.add_stat("c")
+        assert stats.has_stat("c") is False
+        stats.stats = [StatComponent(name="d")]
+        assert stats.has_stat("a") is False
+        assert stats.has_stat("d") is True
+
+    def test_lookups_on_model_construct(self):
+        """Test lookups work on components built without validation."""
+        stats = StatsComponent.model_construct(stats=[StatComponent(name="a", base_value=1.0)])
+        assert stats.get_stat("a").base_value == 1.0
+
+    def test_add_stats_bulk(self):
+        """Test add_stats_bulk adds all stats in order and indexes them."""
+        stats = StatsComponent()
+        stats.add_stat("level", 1.0)
+        added = stats.add_stats_bulk([
+            {"name": "hp", "base_value": 100.0, "min_value": 0.0},
+            {"name": "mp", "base_value": "50", "description": "Mana"},
+        ])
+        assert [stat.name for stat in added] == ["hp", "mp"]
+        assert stats.get_stat_names() == ["level", "hp", "mp"]
+        assert stats.get_stat("mp").current_value == 50.0
+        assert stats.modify_stat("hp", -150.0) == 0.0
+
+    def test_add_stats_bulk_rejects_without_changes(self):
+        """Test add_stats_bulk leaves the collection unchanged on invalid input."""
+        stats = StatsComponent(max_stats=3)
+        stats.add_stat("hp", 10.0)
+        with pytest.raises(ValueError, match="unique"):
+            stats.add_stats_bulk([{"name": "mp"}, {"name": "mp"}])
+        with pytest.raises(ValueError, match="already exists"):
+            stats.add_stats_bulk([{"name": "mp"}, {"name": "hp"}])
+        with pytest.raises(ValueError, match="maximum number of stats"):
+            stats.add_stats_bulk([{"name": "mp"}, {"name": "sp"}, {"name": "xp"}])
+        with pytest.raises(ValidationError):
+            stats.add_stats_bulk([{"name": "mp"}, {"name": "sp", "base_value": "lots"}])
+        assert stats.get_stat_names() == ["hp"]
+
+    def test_add_stats_bulk_rejects_stats_added_directly(self):
+        """Test add_stats_bulk sees names placed into the list or renamed directly."""
+        stats = StatsComponent()
+        stats.add_stat("hp", 10.0)
+        stats.stats.append(StatComponent(name="mp"))
+        with pytest.raises(ValueError, match="'mp' already exists"):
+            stats.add_stats_bulk([{"name": "sp"}, {"name": "mp"}])
+        stats.stats[0].name = "xp"
+        with pytest.raises(ValueError, match="'xp' already exists"):
+            stats.add_stats_bulk([{"name": "xp"}])
+        assert [stat.name for stat in stats.add_stats_bulk([{"name": "hp"}])] == ["hp"]
+        assert stats.get_stat_names() == ["xp", "mp", "hp"]
+
     def test_remove_stat_success(self):
         """Test removing a statistic successfully."""
         stats = StatsComponent()
@@ -455,6 +737,37 @@ class TestStatsComponent:
         assert stats.get_stat("health").current_value == 100.0
         assert stats.get_stat("mana").current_value == 50.0
 
+    def test_reset_all_to_base_respects_constraints(self):
+        """Test reset_all_to_base clamps base values narrowed after creation."""
+        stats = StatsComponent()
+        stats.add_stat("health", base_value=100.0, current_value=50.0, min_value=0.0)
+        stats.get_stat("health").max_value = 80.0
+        stats.reset_all_to_base()
+        assert stats.get_stat("health").current_value == 80.0
+
+    def test_modify_all(self):
+        """Test modify_all applies a modifier to every statistic."""
+        stats = StatsComponent()
+        stats.add_stat("health", base_value=100.0, current_value=75.0, min_value=0.0, max_value=100.0)
+        stats.add_stat("mana", base_value=50.0, current_value=10.0, min_value=0.0)
+        stats.add_stat("strength", base_value=12.0)
+        stats.modify_all(-20.0)
+        assert stats.get_stat("health").current_value == 55.0
+        assert stats.get_stat("mana").current_value == 0.0
+        assert stats.get_stat("strength").current_value == -8.0
+        stats.modify_all(50.0)
+        assert stats.get_stat("health").current_value == 100.0
+
+    def test_apply_modifiers(self):
+        """Test apply_modifiers updates the named statistics only."""
+        stats = StatsComponent()
+        stats.add_stat("health", base_value=100.0, current_value=75.0, min_value=0.0, max_value=100.0)
+        stats.add_stat("mana", base_value=50.0)
+        results = stats.apply_modifiers({"health": 40.0, "mana": -5.0, "nonexistent": 1.0})
+        assert results == {"health": 100.0, "mana": 45.0}
+        assert stats.get_stat("health").current_value == 100.0
+        assert stats.get_stat("mana").current_value == 45.0
+
     def test_get_stat_names(self):
         """Test getting list of all statistic names."""
         stats = StatsComponent()
@@ -517,6 +830,71 @@ class TestStatsComponent:
         assert len(stats.stats) == 2
         assert stats.has_stat("strength") is False
 
+    def test_get_stat_after_construction_from_list(self):
+        """Test name lookups work for stats passed to the constructor."""
+        stats = StatsComponent(stats=[
+            StatComponent(name="strength", base_value=15.0),
+            StatComponent(name="health", base_value=100.0),
+        ])
+        assert stats.get_stat("health").base_value == 100.0
+        stats.remove_stat("strength")
+        assert stats.get_stat("health").base_value == 100.0
+        assert stats.has_stat("strength") is False
+
+    def test_remove_stat_keeps_later_lookups(self):
+        """Test stats after a removed one are still found by name."""
+        stats = StatsComponent()
+        for name in ("strength", "agility", "health", "mana"):
+            stats.add_stat(name, 10.0)
+        stats.remove_stat("agility")
+        assert stats.get_stat_names() == ["strength", "health", "mana"]
+        assert stats.get_stat("health") is stats.stats[1]
+        assert stats.get_stat("mana") is stats.stats[2]
+
+    def test_remove_stat_with_duplicate_names(self):
+        """Test removing a duplicated name exposes the next stat with that name."""
+        stats = StatsComponent(stats=[
+            StatComponent(name="strength", base_value=1.0),
+            StatComponent(name="health", base_value=2.0),
+            StatComponent(name="strength", base_value=3.0),
+        ])
+        assert stats.remove_stat("strength") is True
+        assert stats.get_stat("strength").base_value == 3.0
+        assert stats.get_stat("health").base_value == 2.0
+
+    def test_get_stat_after_stats_reassignment(self):
+        """Test name lookups follow reassignment of the stats list."""
+        stats = StatsComponent()
+        stats.add_stat("strength", 15.0)
+        stats.stats = [StatComponent(name="agility", base_value=12.0)]
+        assert stats.get_stat("strength") is None
+        assert stats.get_stat("agility").base_value == 12.0
+
+    def test_get_stat_after_direct_list_mutation(self):
+        """Test name lookups resync when the stats list is mutated directly."""
+        stats = StatsComponent()
+        stats.add_stat("strength", 15.0)
+        stats.stats.insert(0, StatComponent(name="agility", base_value=12.0))
+        assert stats.get_stat("agility").base_value == 12.0
+        assert stats.get_stat("strength").base_value == 15.0
+
+    def test_from_trusted_round_trip(self):
+        """Test from_trusted rebuilds a StatsComponent from model_dump output."""
+        stats = StatsComponent(max_stats=5)
+        stats.add_stat("health", base_value=100.0, current_value=75.0, min_value=0.0, max_value=100.0)
+        stats.add_stat("mana", base_value=50.0)
+
+        loaded = StatsComponent.from_trusted(stats.model_dump())
+        assert loaded == stats
+        assert loaded.get_stat("health").current_value == 75.0
+        assert loaded.modify_stat("health", 50.0) == 100.0
+
+    def test_from_trusted_defaults_current_value(self):
+        """Test from_trusted defaults current_value to base_value."""
+        loaded = StatsComponent.from_trusted({"stats": [{"name": "strength", "base_value": 12.0}]})
+        assert loaded.get_stat("strength").current_value == 12.0
+        assert loaded.component_type == ComponentType.STAT
+
     def test_stats_component_serialization(self):
         """Test StatsComponent can be serialized."""
         stats = StatsComponent()
@@ -635,6 +1013,12 @@ class TestInventoryCellComponent:
         assert inv.item_id == "sword"
         assert inv.quantity == 1
 
+    def test_add_items_interns_item_id(self):
+        """Test a new stack stores the interned item id."""
+        cell = InventoryCellComponent(max_stack_size=10)
+        cell.add_items("".join(["ar", "row"]), 1)
+        assert cell.item_id is sys.intern("arrow")
+
     def test_add_items_zero_or_negative(self):
         """Test adding zero or negative items."""
         inv = InventoryCellComponent(max_stack_size=10)
@@ -763,6 +1147,25 @@ class TestComponentIntegration:
         assert data["current_value"] == 100.0
         assert data["component_type"] == ComponentType.STAT
 
+    def test_load_json(self):
+        """Test components can be created from a JSON document."""
+        stat = StatComponent.load_json('{"name": "mana", "base_value": 50.0}')
+        assert stat.name == "mana"
+        assert stat.current_value == 50.0  # Defaults to base_value
+
+        inv = InventoryComponent(max_cells=5)
+        inv.add_item("sword", 1)
+        assert InventoryComponent.load_json(inv.model_dump_json()).get_item_count("sword") == 1
+
+    def test_load_json_list(self):
+        """Test a list of components can be created from a JSON array."""
+        stats = StatComponent.load_json_list(
+            '[{"name": "health", "base_value": 100.0, "current_value": 75.0}, {"name": "mana", "base_value": 50.0}]'
+        )
+        assert [stat.name for stat in stats] == ["health", "mana"]
+        assert stats[0].current_value == 75.0
+        assert stats[1].current_value == 50.0
+
     def test_component_model_deserialization(self):
         """Test that components can be created from dict."""
         data = {
@@ -795,6 +1198,16 @@ class TestInventoryComponent:
         assert inv.max_cells == 20
         assert inv.default_max_stack_size == 5
 
+    def test_inventory_component_trims_to_max_cells(self):
+        """Test cells beyond max_cells are dropped and lookups stay consistent."""
+        cells = [InventoryCellComponent() for _ in range(3)]
+        for cell, item_id in zip(cells, ("sword", "axe", "bow")):
+            cell.add_items(item_id, 1)
+        inv = InventoryComponent(max_cells=2, cells=cells)
+        assert len(inv.cells) == 2
+        assert inv.has_item("axe") is True
+        assert inv.has_item("bow") is False
+
     def test_add_item_to_empty_inventory(self):
         """Test adding item to empty inventory."""
         inv = InventoryComponent()
@@ -931,6 +1344,22 @@ class TestInventoryComponent:
         inv.add_item("potion", 3)
         assert inv.get_item_count("potion") == 8
 
+    def test_get_item_count_tracks_mutations(self):
+        """Test get_item_count follows adds, removals and clear_all."""
+        inv = InventoryComponent(max_cells=3, default_max_stack_size=5)
+        inv.add_item("potion", 12)  # Only 3 cells of 5 fit
+        assert inv.get_item_count("potion") == 12
+        inv.add_item("potion", 10)
+        assert inv.get_item_count("potion") == 15
+        inv.remove_item("potion", 7)
+        assert inv.get_item_count("potion") == 8
+        inv.remove_item("potion", 8)
+        assert inv.get_item_count("potion") == 0
+        assert inv.has_item("potion") is False
+        inv.add_item("sword", 1)
+        inv.clear_all()
+        assert inv.get_item_count("sword") == 0
+
     def test_get_item_count_zero(self):
         """Test get_item_count returns 0 for nonexistent item."""
         inv = InventoryComponent()
@@ -966,6 +1395,25 @@ class TestInventoryComponent:
         inv.add_item("potion", 5)
         assert inv.is_full() is False  # Only 2 of 5 cells used
 
+    def test_is_full_tracks_add_and_remove(self):
+        """Test is_full follows cells filling up and being drained."""
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5)
+        inv.add_item("potion", 10)
+        assert inv.is_full() is True
+        inv.remove_item("potion", 1)
+        assert inv.is_full() is False
+        inv.add_item("potion", 1)
+        assert inv.is_full() is True
+
+    def test_is_full_with_cells_from_constructor(self):
+        """Test is_full counts cells passed to the constructor."""
+        cells = [InventoryCellComponent(max_stack_size=5) for _ in range(2)]
+        cells[0].add_items("potion", 5)
+        cells[1].add_items("potion", 5)
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5, cells=cells)
+        assert inv.is_full() is True
+        assert inv.get_empty_cells_count() == 0
+
     def test_clear_all(self):
         """Test clear_all clears all cells."""
         inv = InventoryComponent()
@@ -974,6 +1422,256 @@ class TestInventoryComponent:
         inv.clear_all()
         assert all(cell.is_empty() for cell in inv.cells)
 
+    def test_clear_all_resets_indexes(self):
+        """Test the inventory behaves as empty after clear_all."""
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5)
+        inv.add_item("potion", 10)
+        inv.clear_all()
+        assert inv.get_item_count("potion") == 0
+        assert inv.get_empty_cells_count() == 2
+        assert inv.is_full() is False
+        assert inv.add_item("sword", 1) == 1
+        assert inv.cells[0].item_id == "sword"
+
+    def test_get_item_counts(self):
+        """Test get_item_counts returns totals for every requested item."""
+        inv = InventoryComponent(default_max_stack_size=5)
+        inv.add_item("potion", 7)
+        inv.add_item("herb", 2)
+        assert inv.get_item_counts(["potion", "herb", "gem"]) == {"potion": 7, "herb": 2, "gem": 0}
+
+    def test_counts_is_live_read_only_view(self):
+        """Test counts exposes per-item totals without allowing writes."""
+        inv = InventoryComponent(default_max_stack_size=5)
+        inv.add_item("potion", 7)
+        counts = inv.counts
+        inv.add_item("herb", 2)
+        assert dict(counts) == {"potion": 7, "herb": 2}
+        inv.clear_all()
+        assert dict(counts) == {}
+        with pytest.raises(TypeError):
+            counts["potion"] = 100
+
+    def test_add_item_reuses_first_empty_cell(self):
+        """Test adding item fills the lowest emptied cell before appending."""
+        inv = InventoryComponent(max_cells=5)
+        inv.add_item("item1", 1)
+        inv.add_item("item2", 1)
+        inv.add_item("item3", 1)
+        inv.remove_item("item2", 1)
+        inv.remove_item("item1", 1)
+        inv.add_item("item4", 1)
+        assert len(inv.cells) == 3
+        assert inv.cells[0].item_id == "item4"
+        assert inv.cells[1].is_empty()
+
+    def test_item_lookups_after_construction_from_cells(self):
+        """Test item lookups work for cells passed to the constructor."""
+        cells = [InventoryCellComponent(max_stack_size=5) for _ in range(3)]
+        cells[0].add_items("potion", 2)
+        cells[2].add_items("potion", 4)
+        inv = InventoryComponent(default_max_stack_size=5, cells=cells)
+        assert inv.get_item_count("potion") == 6
+        assert inv.add_item("potion", 5) == 5
+        assert inv.cells[0].quantity == 5
+        assert inv.cells[1].quantity == 1
+        assert inv.cells[2].quantity == 5
+
+    def test_rebuild_index_after_direct_cell_changes(self):
+        """Test rebuild_index picks up cells modified directly."""
+        inv = InventoryComponent(default_max_stack_size=5)
+        inv.add_item("potion", 2)
+        inv.cells[0].add_items("potion", 3)
+        inv.rebuild_index()
+        assert inv.get_item_count("potion") == 5
+        assert inv.has_item("potion", 5) is True
+
+    def test_lookups_follow_direct_cell_changes(self):
+        """Test item lookups follow cells changed without going through the inventory."""
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5)
+        inv.add_item("potion", 3)
+        inv.cells[0].quantity = 0
+        assert inv.get_item_count("potion") == 0
+        assert inv.has_item("potion") is False
+        assert inv.get_empty_cells_count() == 1
+        inv.cells[0].add_items("herb", 5)
+        assert inv.counts["herb"] == 5
+        inv.cells[0].remove_items(1)
+        assert inv.get_item_count("herb") == 4
+        inv.cells[0].clear_slot()
+        assert inv.get_item_count("herb") == 0
+        assert inv.add_item("potion", 1) == 1
+        assert inv.cells[0].item_id == "potion"
+
+    def test_lookups_follow_direct_list_changes(self):
+        """Test item lookups follow cells added, replaced or removed on the list itself."""
+        inv = InventoryComponent(max_cells=3, default_max_stack_size=5)
+        inv.add_item("sword", 1)
+        cell = InventoryCellComponent(max_stack_size=5)
+        cell.add_items("potion", 2)
+        inv.cells.append(cell)
+        assert inv.get_item_count("potion") == 2
+        assert inv.add_item("potion", 3) == 3
+        assert len(inv.cells) == 2
+        assert cell.quantity == 5
+
+        replacement = InventoryCellComponent(max_stack_size=5)
+        replacement.add_items("herb", 1)
+        inv.cells[0] = replacement
+        assert inv.get_item_count("sword") == 0
+        assert inv.get_item_count("herb") == 1
+        del inv.cells[1]
+        assert inv.get_item_count("potion") == 0
+        assert inv.is_full() is False
+
+    def test_reassigned_cells_are_tracked(self):
+        """Test cells assigned to the inventory report later direct changes."""
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5)
+        cells = [InventoryCellComponent(max_stack_size=5) for _ in range(2)]
+        inv.cells = cells
+        cells[1].add_items("potion", 4)
+        assert inv.get_item_count("potion") == 4
+        assert inv.cells[1] is cells[1]
+
+    def test_lookups_on_model_construct(self):
+        """Test an inventory built with model_construct indexes its cells."""
+        cells = [InventoryCellComponent(max_stack_size=5) for _ in range(2)]
+        cells[0].add_items("potion", 5)
+        cells[1].add_items("potion", 5)
+        inv = InventoryComponent.model_construct(cells=cells, max_cells=2)
+        assert inv.get_item_count("potion") == 10
+        assert inv.is_full() is True
+        assert inv.remove_item("potion", 6) == 6
+        assert inv.get_empty_cells_count() == 1
+
+    def test_add_item_failing_new_cell_keeps_lookups(self):
+        """Test lookups stay correct when creating a new cell fails midway through add_item."""
+        inv = InventoryComponent(max_cells=3, default_max_stack_size=5)
+        inv.add_item("potion", 3)
+        with pytest.raises(ValidationError):
+            inv.add_item("potion", 10, max_stack_size=0)
+        assert inv.cells[0].quantity == 5
+        assert inv.get_item_count("potion") == 5
+        assert inv.has_item("potion", 5) is True
+        assert inv.is_full() is False
+
+    def test_cells_shared_between_inventories(self):
+        """Test every inventory holding a cell follows changes made through another."""
+        cell = InventoryCellComponent(max_stack_size=10)
+        cell.add_items("potion", 2)
+        first = InventoryComponent(cells=[cell])
+        second = InventoryComponent(cells=[cell])
+        cell.add_items("potion", 3)
+        assert first.get_item_count("potion") == 5
+        assert second.get_item_count("potion") == 5
+
+        source = InventoryComponent(default_max_stack_size=5)
+        source.add_item("gem", 4)
+        other = InventoryComponent(cells=list(source.cells))
+        assert other.remove_item("gem", 4) == 4
+        assert source.get_item_count("gem") == 0
+        assert source.has_item("gem") is False
+        other.add_item("gem", 2)
+        assert source.get_item_count("gem") == 2
+        source.clear_all()
+        assert other.get_item_count("gem") == 0
+
+    def test_cells_compare_equal_inside_and_outside_inventory(self):
+        """Test index bookkeeping does not affect cell or inventory equality."""
+        inv = InventoryComponent(default_max_stack_size=5)
+        inv.add_item("potion", 2)
+        cell = InventoryCellComponent(max_stack_size=5)
+        cell.add_items("potion", 2)
+        assert inv.cells[0] == cell
+        assert inv == InventoryComponent(default_max_stack_size=5, cells=[cell])
+
+    def test_pickle_round_trip_keeps_lookups(self):
+        """Test an unpickled inventory indexes its cells and tracks direct changes."""
+        inv = InventoryComponent(max_cells=2, default_max_stack_size=5)
+        inv.add_item("potion", 7)
+        loaded = pickle.loads(pickle.dumps(inv))
+        assert loaded == inv
+        assert loaded.get_item_count("potion") == 7
+        loaded.cells[1].add_items("potion", 3)
+        assert loaded.is_full() is True
+        assert inv.is_full() is False
+
+    def test_model_copy_shares_indexes(self):
+        """Test a shallow copy and its original keep seeing each other's changes."""
+        inv = InventoryComponent(max_cells=2)
+        inv.add_item("potion", 1)
+        cp = inv.model_copy()
+        cp.add_item("potion", 1)
+        assert inv.is_full() is True
+        assert inv.get_item_count("potion") == 2
+        inv.remove_item("potion", 2)
+        assert cp.is_full() is False
+        assert cp.get_empty_cells_count() == 2
+
+    def test_deep_copy_is_independent_and_equal(self):
+        """Test a deep copy gets its own indexes and still compares equal."""
+        inv = InventoryComponent(max_cells=2)
+        inv.add_item("potion", 1)
+        cp = inv.model_copy(deep=True)
+        assert cp == inv
+        cp.add_item("potion", 1)
+        assert cp.is_full() is True
+        assert inv.is_full() is False
+        assert inv.get_item_count("potion") == 1
+
+    def test_from_trusted_round_trip(self):
+        """Test from_trusted rebuilds an InventoryComponent from model_dump output."""
+        inv = InventoryComponent(max_cells=5, default_max_stack_size=5)
+        inv.add_item("potion", 7)
+        inv.add_item("sword", 1)
+
+        loaded = InventoryComponent.from_trusted(inv.model_dump(mode="json"))
+        assert loaded.cells[0].component_type == ComponentType.INVENTORY
+        assert loaded.get_item_count("potion") == 7
+        assert loaded.add_item("potion", 3) == 3
+        assert loaded.cells[1].quantity == 5
+
+    def test_add_item_interns_item_id(self):
+        """Test that cells store interned item ids."""
+        inv = InventoryComponent()
+        inv.add_item("".join(["sw", "ord"]), 1)
+        inv.add_item("".join(["a", "xe"]), 1)
+        assert inv.cells[0].item_id is sys.intern("sword")
+        assert InventoryCellComponent(item_id="".join(["a", "xe"]), quantity=1).item_id is inv.cells[1].item_id
+
+    def test_add_items_batch(self):
+        """Test add_items combines quantities per item and reports each pair."""
+        inv = InventoryComponent(max_cells=3, default_max_stack_size=5)
+        added = inv.add_items([("potion", 4), ("sword", 1), ("potion", 3), ("gem", 0)])
+        assert added == [4, 1, 3, 0]
+        assert [cell.item_id for cell in inv.cells] == ["potion", "potion", "sword"]
+        assert inv.get_item_count("potion") == 7
+
+    def test_add_items_batch_partial(self):
+        """Test add_items assigns a partial add to earlier pairs first."""
+        inv = InventoryComponent(max_cells=1, default_max_stack_size=5)
+        assert inv.add_items([("potion", 3), ("potion", 3), ("sword", 1)]) == [3, 2, 0]
+
+    def test_to_dict_matches_model_dump(self):
+        """Test to_dict produces the model_dump structure and loads with from_trusted."""
+        inv = InventoryComponent(max_cells=5, default_max_stack_size=5, owner="player")
+        inv.add_item("potion", 7)
+        inv.add_item("sword", 1)
+        inv.remove_item("potion", 5)
+        inv.cells[2].rarity = "rare"
+
+        data = inv.to_dict()
+        assert data == inv.model_dump()
+        loaded = InventoryComponent.from_trusted(data)
+        assert loaded.model_dump() == data
+        assert loaded.get_item_count("potion") == 2
+
+    def test_from_trusted_interns_item_ids(self):
+        """Test from_trusted shares one string object per item id."""
+        data = {"cells": [{"item_id": "".join(["sw", "ord"]), "quantity": 1} for _ in range(2)]}
+        loaded = InventoryComponent.from_trusted(data)
+        assert loaded.cells[0].item_id is loaded.cells[1].item_id is sys.intern("sword")
+
     def test_inventory_component_serialization(self):
         """Test InventoryComponent can be serialized."""
         inv = InventoryComponent(max_cells=5)
@@ -983,3 +1681,93 @@ class TestInventoryComponent:
         assert "max_cells" in data
         assert len(data["cells"]) == 1
 
+
+class TestStatData:
+    """Tests for StatData (runtime counterpart of StatComponent)."""
+
+    def test_modify_value_respects_constraints(self):
+        """Test modify_value clamps to min/max."""
+        stat = StatData(name="health", base_value=50.0, current_value=50.0, min_value=0.0, max_value=100.0)
+        assert stat.modify_value(80.0) == 100.0
+        assert stat.modify_value(-150.0) == 0.0
+
+    def test_set_base_value_and_reset(self):
+        """Test set_base_value clamps and reset_to_base restores current value."""
+        stat = StatData(name="mana", base_value=50.0, current_value=50.0, max_value=100.0)
+        assert stat.set_base_value(150.0) == 100.0
+        stat.modify_value(-30.0)
+        stat.reset_to_base()
+        assert stat.current_value == 100.0
+
+    def test_round_trip_with_stat_component(self):
+        """Test conversion between StatComponent and StatData."""
+        component = StatComponent(name="health", base_value=100.0, current_value=75.0, min_value=0.0, description="HP")
+        data = component.to_data()
+        assert data == StatData("health", 100.0, 75.0, 0.0, None, "HP")
+        assert StatComponent.from_data(data) == component
+
+    def test_from_data_matches_validated_stat(self):
+        """Test from_data builds the same stat as validation, and still validates odd input."""
+        data = StatData(name="hp", base_value=150, current_value=-3.0, min_value=0, max_value=100)
+        expected = StatComponent(name="hp", base_value=150, current_value=-3.0, min_value=0, max_value=100)
+        assert StatComponent.from_data(data).model_dump() == expected.model_dump()
+        with pytest.raises(ValidationError):
+            StatComponent.from_data(StatData(name="hp", base_value="lots", current_value=0.0))
+
+    def test_json_list_round_trip(self):
+        """Test StatData lists survive a JSON round trip."""
+        stats = [StatData("health", 100.0, 75.0, 0.0, 100.0), StatData("mana", 50.0, 50.0)]
+        assert StatData.load_json_list(StatData.dump_json_list(stats)) == stats
+
+    def test_has_no_instance_dict(self):
+        """Test StatData uses slots."""
+        assert not hasattr(StatData(name="strength"), "__dict__")
+
+    def test_smaller_than_stat_component(self):
+        """Test StatData has a smaller footprint than StatComponent."""
+        component = StatComponent(name="strength", base_value=10.0)
+        component_size = sys.getsizeof(component) + sys.getsizeof(component.__dict__)
+        assert sys.getsizeof(component.to_data()) < component_size
+
+    def test_round_trip_with_stats_component(self):
+        """Test conversion between StatsComponent and a StatData list."""
+        stats = StatsComponent(max_stats=3)
+        stats.add_stat("health", base_value=100.0, current_value=75.0, min_value=0.0, max_value=100.0)
+        stats.add_stat("mana", base_value=50.0)
+
+        data = stats.to_data()
+        for item in data:
+            item.modify_value(-10.0)
+
+        restored = StatsComponent.from_data(data, max_stats=3)
+        assert restored.max_stats == 3
+        assert restored.get_stat("health").current_value == 65.0
+        assert restored.get_stat("mana").current_value == 40.0
+
+
+class TestCellData:
+    """Tests for CellData (runtime counterpart of InventoryCellComponent)."""
+
+    def test_add_and_remove_items(self):
+        """Test stacking and draining a cell."""
+        cell = CellData(max_stack_size=5)
+        assert cell.add_items("potion", 3) == 3
+        assert cell.add_items("axe", 1) == 0
+        assert cell.add_items("potion", 5) == 2
+        assert cell.is_full() is True
+        assert cell.remove_items(10) == 5
+        assert cell.is_empty() is True
+        assert cell.item_id is None
+
+    def test_json_list_round_trip(self):
+        """Test CellData lists survive a JSON round trip."""
+        cells = [CellData("potion", 3, 5), CellData()]
+        assert CellData.load_json_list(CellData.dump_json_list(cells)) == cells
+
+    def test_round_trip_with_inventory_cell_component(self):
+        """Test conversion between InventoryCellComponent and CellData."""
+        component = InventoryCellComponent(max_stack_size=10, slot_type="potion")
+        component.add_items("potion", 7)
+        data = component.to_data()
+        assert data == CellData("potion", 7, 10, "potion", False)
+        assert InventoryCellComponent.from_data(data) == component